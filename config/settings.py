@@ -16,7 +16,11 @@ ZOHO_CONFIG = {
 
 # Migration settings
 BATCH_SIZE = 200
-MAX_WORKERS = 7  # Will be overridden by CPU count in main.py
+MAX_WORKERS = 10  # concurrent API threads; I/O-bound, so keep within the Zoho edition's concurrency limit, not CPU count
 RATE_LIMIT_DELAY = 0.3  # seconds between API calls
+ZOHO_REQUESTS_PER_SECOND = 10  # shared Zoho request ceiling across all worker threads
 UPDATE_INTERVAL = 5  # seconds between progress updates
-MAX_RETRIES = 3
\ No newline at end of file
+MAX_RETRIES = 3
+ODOO_TIMEOUT = (10, 300)  # connect/read seconds per Odoo RPC; a hung request then fails and is retried
+ZOHO_TIMEOUT = (10, 120)  # connect/read seconds per Zoho API call; covers a 100-record bulk write
+EXPORT_GZIP = False  # compress property CSV exports (.csv.gz) at gzip level 1
\ No newline at end of file
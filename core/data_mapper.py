@@ -1,401 +1,443 @@
 # core/data_mapper.py
 
+import sys
 from datetime import datetime
 from typing import Dict, Any, Optional
+from types import MappingProxyType
 from utils.validators import DataValidator
 import logging
 
+logger = logging.getLogger(__name__)
+
+# Validators bound once so the mappers skip the class attribute lookup per call
+_validate_email = DataValidator.validate_email
+_validate_phone = DataValidator.validate_phone
+_validate_name = DataValidator.validate_name
+
+# Fixed tag values stamped on every mapped record, interned once so each
+# record shares the same string objects
+_LEAD_SOURCE = sys.intern('Odoo Migration')
+_CONTACT_TYPE = sys.intern('Imported Contact')
+_NA = sys.intern('N/A')
+_UNKNOWN = sys.intern('Unknown')
+_UNKNOWN_COMPANY = sys.intern('Unknown Company')
+
+# Ownership types that are migrated; everything else is skipped
+_VALID_OWNERSHIP = frozenset(('freehold', 'leashold'))
+
+# Lead stage mapping (lowercased Odoo stage name -> Zoho lead status)
+_STAGE_MAPPING = MappingProxyType({
+    'new': 'New',
+    'qualified': 'Qualified',
+    'proposition': 'Proposition',
+    'won': 'Closed Won',
+    'lost': 'Closed Lost',
+})
+
+# Property type mapping based on account_asset.csv
+_PROPERTY_TYPE_MAPPING = MappingProxyType({
+    'apartment': 'Apartment',
+    'villa': 'Villa',
+    'warehouse': 'Warehouse',
+    'commercial_villa': 'Commercial Villa',
+    'mixed_used_building': 'Mixed Used Building',
+    'commercial_building': 'Commercial Building',
+    'townhouse': 'Townhouse',
+    'plot': 'Residential Land',
+    'commercial_plot': 'Commercial Land',
+    'residential_building': 'Residential Building',
+    'retail': 'Retail',
+    'office': 'Office',
+    'labour_camp': 'Labour Camp',
+    'multiple_units': 'Bulk Units'
+})
+
+# Bedroom mapping based on unit.bedrooms_unit_types.csv
+_BEDROOM_MAPPING = MappingProxyType({
+    'Studio': 'Studio',
+    '0': '0',
+    '1': '1',
+    '2': '2',
+    '3': '3',
+    '4': '4',
+    '5': '5',
+    '6': '6',
+    '7': '7',
+    '8': '8',
+    'NULL': 'N/A',
+    'n/a': 'N/A'
+})
+
+# Mapping for property status
+_PROPERTY_STATUS_MAPPING = MappingProxyType({
+    'draft': 'Available',
+    'book': 'Reserved',
+    'normal': 'Leased',
+    'close': 'Sold',
+    'sold': 'Sold',
+    'cancel': 'Cancelled',
+    'block': 'Blocked',
+    'upcoming': 'Upcoming'
+})
+
+# Mapping for property details (sale/rent)
+_PROPERTY_DETAILS_MAPPING = MappingProxyType({
+    'sale': 'For Sale',
+    'rent': 'For Rent',
+    'both': 'None'
+})
+
+# Mapping for furnishing status
+_FURNISHING_MAPPING = MappingProxyType({
+    'none': 'NO',
+    'semi_furnished': 'YES',
+    'full_furnished': 'YES'
+})
+
+# Boolean amenity fields on property.master, paired with their display labels
+_AMENITY_FIELDS = (
+    'gym', 'swimming_pool', 'beach', 'medical_center', 'schools',
+    'shopping_malls', 'restaurants', 'marina', 'golf_course'
+)
+_AMENITY_LABELS = tuple(
+    (field, field.replace('_', ' ').title()) for field in _AMENITY_FIELDS
+)
+
+# str.translate table that drops every ASCII character except digits and '.'
+_CURRENCY_DELETE_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128) if not (chr(c).isdigit() or chr(c) == '.')
+))
+
+def _rel(relation: Any) -> str:
+    """Return the display name of a many2one ``[id, name]`` value, or ''"""
+    try:
+        return relation[1] if relation else ''
+    except (TypeError, IndexError, KeyError):
+        return ''
+
 class ContactMapper:
     @staticmethod
     def map_contact(odoo_contact: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Map Odoo contact fields to Zoho contact fields with validation"""
-        
-        print('odoo_contact:         ', odoo_contact)
-        print('-------------------------------------------')
-        try:
-            # Clean and validate name
-            full_name = DataValidator.validate_name(odoo_contact.get('name', ''))
-            if not full_name:
-                return None
-
-            # Split name
-            name_parts = full_name.split(' ', 1)
-            first_name = name_parts[0]
-            last_name = name_parts[1] if len(name_parts) > 1 else 'N/A'
-
-            # Clean and validate contact data
-            email = DataValidator.validate_email(odoo_contact.get('email'))
-            phone = DataValidator.validate_phone(odoo_contact.get('phone'))
-            mobile = DataValidator.validate_phone(odoo_contact.get('mobile'))
-
-            zoho_contact = {
-                'First_Name': first_name,
-                'Last_Name': last_name,
-                'Phone': phone,
-                'Mobile': mobile,
-                'Description': odoo_contact.get('comment', ''),
-                'Odoo_ID': odoo_contact.get('contact_id'),
-                'Lead_Source': 'Odoo Migration',
-                'Contact_Type': 'Imported Contact'
-            }
-
-            # Only add email if valid
-            if email:
-                zoho_contact['Email'] = email
-
-            # Remove empty fields
-            return {k: v for k, v in zoho_contact.items() if v}
-
-        except Exception as e:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("odoo_contact: %r", odoo_contact)
+        # Clean and validate name
+        full_name = _validate_name(odoo_contact.get('name', ''))
+        if not full_name:
             return None
+
+        # Clean and validate contact data
+        return ContactMapper._build_contact(
+            odoo_contact,
+            full_name,
+            _validate_email(odoo_contact.get('email')),
+            _validate_phone(odoo_contact.get('phone')),
+            _validate_phone(odoo_contact.get('mobile'))
+        )
+
+    @staticmethod
+    def _build_contact(odoo_contact: Dict[str, Any], full_name: str, email: Optional[str],
+                       phone: Optional[str], mobile: Optional[str]) -> Dict[str, Any]:
+        """Assemble the Zoho contact from already validated values"""
+        # Split name
+        first_name, _, last_name = full_name.partition(' ')
+        last_name = last_name or _NA
+
+        # Only non-empty fields are added
+        zoho_contact = {
+            'First_Name': first_name,
+            'Last_Name': last_name,
+        }
+        if phone:
+            zoho_contact['Phone'] = phone
+        if mobile:
+            zoho_contact['Mobile'] = mobile
+        description = odoo_contact.get('comment', '')
+        if description:
+            zoho_contact['Description'] = description
+        odoo_id = odoo_contact.get('contact_id')
+        if odoo_id:
+            zoho_contact['Odoo_ID'] = odoo_id
+        zoho_contact['Lead_Source'] = _LEAD_SOURCE
+        zoho_contact['Contact_Type'] = _CONTACT_TYPE
+
+        # Only add email if valid
+        if email:
+            zoho_contact['Email'] = email
+
+        return zoho_contact
         
 class LeadMapper:
     @staticmethod
     def map_lead(odoo_lead: Dict[str, Any], contact_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Map Odoo lead fields to Zoho lead fields with validation"""
-        logger = logging.getLogger(__name__)
-        print('odoo_lead:         ', odoo_lead)
-        print('-------------------------------------------')
-        try:
-            logger.debug(f"Mapping lead: {odoo_lead}")
-
-            # Clean and validate data
-            company = DataValidator.validate_name(odoo_lead.get('partner_name', ''))
-            contact_name = DataValidator.validate_name(odoo_lead.get('contact_name', ''))
-            email = DataValidator.validate_email(odoo_lead.get('email_from'))
-            phone = DataValidator.validate_phone(odoo_lead.get('phone'))
-            mobile = DataValidator.validate_phone(odoo_lead.get('mobile'))
-
-            # Map lead stage
-            stage_mapping = {
-                'new': 'New',
-                'qualified': 'Qualified',
-                'proposition': 'Proposition',
-                'won': 'Closed Won',
-                'lost': 'Closed Lost',
-            }
-            
-            # Extract stage name safely
-            stage_id = odoo_lead.get('stage_id')
-            stage_name = stage_id[1].lower() if isinstance(stage_id, (list, tuple)) and len(stage_id) > 1 else 'new'
-            stage = stage_mapping.get(stage_name, 'New')
-
-            # Extract source safely
-            source_id = odoo_lead.get('source_id')
-            source = source_id[1] if isinstance(source_id, (list, tuple)) and len(source_id) > 1 else 'Odoo Migration'
-
-            zoho_lead = {
-                'Lead_Source': source,
-                'Lead_Status': stage
-            }
-
-            # Add company name if available
-            if company:
-                zoho_lead['Company'] = company
-            elif odoo_lead.get('name'):  # Use lead name as company if no company name
-                zoho_lead['Company'] = odoo_lead['name']
-            else:
-                zoho_lead['Company'] = 'Unknown Company'
-
-            # Add contact name if available
-            if contact_name:
-                name_parts = contact_name.split(' ', 1)
-                zoho_lead['First_Name'] = name_parts[0]
-                if len(name_parts) > 1:
-                    zoho_lead['Last_Name'] = name_parts[1]
-                else:
-                    zoho_lead['Last_Name'] = 'Unknown'
-            else:
-                zoho_lead['Last_Name'] = 'Unknown'
-
-            # Add contact information
-            if phone:
-                zoho_lead['Phone'] = phone
-            if mobile:
-                zoho_lead['Mobile'] = mobile
-            if email:
-                zoho_lead['Email'] = email
-
-            # Add description if available
-            if odoo_lead.get('description'):
-                zoho_lead['Description'] = odoo_lead['description']
-
-            # Add revenue and probability if available
-            if odoo_lead.get('expected_revenue'):
-                try:
-                    zoho_lead['Expected_Revenue'] = float(odoo_lead['expected_revenue'])
-                except (ValueError, TypeError):
-                    pass
-
-            if odoo_lead.get('probability'):
-                try:
-                    zoho_lead['Probability'] = float(odoo_lead['probability'])
-                except (ValueError, TypeError):
-                    pass
-
-            # Link to existing contact if provided
-            if contact_id:
-                zoho_lead['Contact_Id'] = contact_id
-            # Assign the Lead to Specific User
-            zoho_lead['Owner'] = '6421814000003834001'
-
-            logger.debug(f"Mapped lead data: {zoho_lead}")
-            return zoho_lead
-
-        except Exception as e:
-            logger.error(f"Error mapping lead: {str(e)}")
-            logger.debug(f"Original lead data: {odoo_lead}")
-            return None
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Mapping lead: %r", odoo_lead)
+
+        # Clean and validate data
+        company = _validate_name(odoo_lead.get('partner_name', ''))
+        contact_name = _validate_name(odoo_lead.get('contact_name', ''))
+        email = _validate_email(odoo_lead.get('email_from'))
+        phone = _validate_phone(odoo_lead.get('phone'))
+        mobile = _validate_phone(odoo_lead.get('mobile'))
+
+        # Extract stage and source names safely
+        stage = _STAGE_MAPPING.get((_rel(odoo_lead.get('stage_id')) or 'new').lower(), 'New')
+        source = _rel(odoo_lead.get('source_id')) or _LEAD_SOURCE
+
+        zoho_lead = {
+            'Lead_Source': source,
+            'Lead_Status': stage
+        }
+
+        # Add company name if available
+        lead_name = odoo_lead.get('name')
+        if company:
+            zoho_lead['Company'] = company
+        elif lead_name:  # Use lead name as company if no company name
+            zoho_lead['Company'] = lead_name
+        else:
+            zoho_lead['Company'] = _UNKNOWN_COMPANY
+
+        # Add contact name if available
+        if contact_name:
+            first_name, _, last_name = contact_name.partition(' ')
+            zoho_lead['First_Name'] = first_name
+            zoho_lead['Last_Name'] = last_name or _UNKNOWN
+        else:
+            zoho_lead['Last_Name'] = _UNKNOWN
+
+        # Add contact information
+        if phone:
+            zoho_lead['Phone'] = phone
+        if mobile:
+            zoho_lead['Mobile'] = mobile
+        if email:
+            zoho_lead['Email'] = email
+
+        # Add description if available
+        description = odoo_lead.get('description')
+        if description:
+            zoho_lead['Description'] = description
+
+        # Add revenue and probability if available
+        expected_revenue = odoo_lead.get('expected_revenue')
+        if expected_revenue:
+            try:
+                zoho_lead['Expected_Revenue'] = float(expected_revenue)
+            except (ValueError, TypeError):
+                pass
+
+        probability = odoo_lead.get('probability')
+        if probability:
+            try:
+                zoho_lead['Probability'] = float(probability)
+            except (ValueError, TypeError):
+                pass
+
+        # Link to existing contact if provided
+        if contact_id:
+            zoho_lead['Contact_Id'] = contact_id
+        # Assign the Lead to Specific User
+        zoho_lead['Owner'] = '6421814000003834001'
+
+        if debug:
+            logger.debug("Mapped lead data: %r", zoho_lead)
+        return zoho_lead
         
         
         
 class PropertyMapper:
-    # @staticmethod
-    def map_property(self , odoo_property: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Map Odoo property fields to Zoho property fields with validation"""
-        print('odoo_property:         ', odoo_property)
-        print('-------------------------------------------')
-        try:
-            # Check ownership type - only proceed if freehold or leashold
-            ownership_type = odoo_property.get('ownership_type')
-            if ownership_type not in ['freehold', 'leashold']:
-                return None
-
-            # Get related field values safely
-            type_id = odoo_property.get('type_id', [False, ''])
-            property_type = type_id[1] if isinstance(type_id, (list, tuple)) and len(type_id) > 1 else ''
-            
-            community_id = odoo_property.get('property_community_id', [False, ''])
-            community = community_id[1] if isinstance(community_id, (list, tuple)) and len(community_id) > 1 else ''
-            
-            sub_community_id = odoo_property.get('property_sub_community_id', [False, ''])
-            sub_community = sub_community_id[1] if isinstance(sub_community_id, (list, tuple)) and len(sub_community_id) > 1 else ''
-
-            # Map the property to Zoho format
-            property_data = {
-                'Properties / Units Id': f"odoo_{odoo_property.get('id', '')}",
-                'Unit Code': odoo_property.get('property_code', ''),
-                'Properties / Units Owner': odoo_property.get('owner_id', [False, ''])[1] if isinstance(odoo_property.get('owner_id'), (list, tuple)) else '',
-                'Status': 'false',  # Default status as per sample
-                'Created Time': odoo_property.get('create_date', ''),
-                'Modified Time': odoo_property.get('write_date', ''),
-                'Tag': 'Freehold' if ownership_type == 'freehold' else 'Leasehold',
-                
-                # Property specific fields
-                'Unit Name': odoo_property.get('name', ''),
-                'Unit Types': property_type,
-                'Property Details': 'For Sale' if odoo_property.get('property_type') == 'sale' else 'For Lease',
-                'Building Name': odoo_property.get('name', ''),
-                'Property Description': odoo_property.get('property_overview', ''),
-                'Property Description (AR)': '',  # No Arabic description in Odoo
-                'Ref.No': odoo_property.get('ref_no', ''),
-                
-                # Location details
-                'Community': community,
-                'Sub Community': sub_community,
-                'Country': odoo_property.get('country_id', [False, ''])[1] if isinstance(odoo_property.get('country_id'), (list, tuple)) else '',
-                'State': odoo_property.get('state_id', [False, ''])[1] if isinstance(odoo_property.get('state_id'), (list, tuple)) else '',
-                'City': odoo_property.get('city_id', [False, ''])[1] if isinstance(odoo_property.get('city_id'), (list, tuple)) else '',
-                
-                # Additional details
-                'Covered Area': str(odoo_property.get('builtup_area', '')),
-                'Other Area': str(odoo_property.get('plot_area', '')),
-                'Handover Date': odoo_property.get('handover_date', ''),
-                'Possession Status': 'Under Construction' if odoo_property.get('off_plan_property') else 'Ready',
-                'Maintenance fee': odoo_property.get('maintanence_fee_per_sq_ft', ''),
-                
-                # Get amenities
-                'Private Amenities': self._get_amenities_string(odoo_property),
-                
-                # Location coordinates
-                'Geopoints': f"{odoo_property.get('latitude', '')},{odoo_property.get('longitude', '')}" if odoo_property.get('latitude') and odoo_property.get('longitude') else ''
-            }
+    # Every column map_property can emit, in export order; rows leave unset columns blank
+    CSV_FIELDS = [
+        'Properties / Units Id', 'Unit Code', 'Properties / Units Owner', 'Status',
+        'Created Time', 'Modified Time', 'Tag', 'Unit Name', 'Unit Types', 'Property Details',
+        'Building Name', 'Property Description', 'Ref.No', 'Community', 'Sub Community',
+        'Country', 'State', 'City', 'Covered Area', 'Other Area', 'Handover Date',
+        'Possession Status', 'Maintenance fee', 'Private Amenities', 'Geopoints'
+    ]
 
-            # Remove empty fields
-            return {k: v for k, v in property_data.items() if v}
-
-        except Exception as e:
-            print(f"Error mapping property: {str(e)}")
+    @staticmethod
+    def map_property(odoo_property: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Map Odoo property fields to Zoho property fields with validation"""
+        # Check ownership type - only proceed if freehold or leashold
+        ownership_type = odoo_property.get('ownership_type')
+        if ownership_type not in _VALID_OWNERSHIP:
             return None
 
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("odoo_property: %r", odoo_property)
+
+        # Get related field values safely
+        property_type = _rel(odoo_property.get('type_id'))
+        community = _rel(odoo_property.get('property_community_id'))
+        sub_community = _rel(odoo_property.get('property_sub_community_id'))
+        owner = _rel(odoo_property.get('owner_id'))
+
+        name = odoo_property.get('name', '')
+        country = _rel(odoo_property.get('country_id'))
+        state = _rel(odoo_property.get('state_id'))
+        city = _rel(odoo_property.get('city_id'))
+
+        # Map the property to Zoho format, adding only non-empty fields
+        property_data = {}
+        odoo_id = odoo_property.get('id')
+        if odoo_id is not None:
+            property_data['Properties / Units Id'] = 'odoo_' + str(odoo_id)
+        unit_code = odoo_property.get('property_code', '')
+        if unit_code:
+            property_data['Unit Code'] = unit_code
+        if owner:
+            property_data['Properties / Units Owner'] = owner
+        property_data['Status'] = 'false'  # Default status as per sample
+        created = odoo_property.get('create_date', '')
+        if created:
+            property_data['Created Time'] = created
+        modified = odoo_property.get('write_date', '')
+        if modified:
+            property_data['Modified Time'] = modified
+        property_data['Tag'] = 'Freehold' if ownership_type == 'freehold' else 'Leasehold'
+
+        # Property specific fields
+        if name:
+            property_data['Unit Name'] = name
+        if property_type:
+            property_data['Unit Types'] = property_type
+        property_data['Property Details'] = 'For Sale' if odoo_property.get('property_type') == 'sale' else 'For Lease'
+        if name:
+            property_data['Building Name'] = name
+        description = odoo_property.get('property_overview', '')
+        if description:
+            property_data['Property Description'] = description
+        # No Arabic description in Odoo, so 'Property Description (AR)' is never set
+        ref_no = odoo_property.get('ref_no', '')
+        if ref_no:
+            property_data['Ref.No'] = ref_no
+
+        # Location details
+        if community:
+            property_data['Community'] = community
+        if sub_community:
+            property_data['Sub Community'] = sub_community
+        if country:
+            property_data['Country'] = country
+        if state:
+            property_data['State'] = state
+        if city:
+            property_data['City'] = city
+
+        # Additional details
+        covered_area = str(odoo_property.get('builtup_area', ''))
+        if covered_area:
+            property_data['Covered Area'] = covered_area
+        other_area = str(odoo_property.get('plot_area', ''))
+        if other_area:
+            property_data['Other Area'] = other_area
+        handover = odoo_property.get('handover_date', '')
+        if handover:
+            property_data['Handover Date'] = handover
+        property_data['Possession Status'] = 'Under Construction' if odoo_property.get('off_plan_property') else 'Ready'
+        maintenance_fee = odoo_property.get('maintanence_fee_per_sq_ft', '')
+        if maintenance_fee:
+            property_data['Maintenance fee'] = maintenance_fee
+
+        # Get amenities
+        amenities = PropertyMapper._get_amenities_string(odoo_property)
+        if amenities:
+            property_data['Private Amenities'] = amenities
+
+        # Location coordinates
+        latitude = odoo_property.get('latitude')
+        longitude = odoo_property.get('longitude')
+        if latitude and longitude:
+            property_data['Geopoints'] = f"{latitude},{longitude}"
+
+        return property_data
+
     @staticmethod
     def _get_amenities_string(odoo_property: Dict[str, Any]) -> str:
         """Combine all amenities into a semicolon-separated string"""
-        amenities = []
-        
+        get = odoo_property.get
+
         # Check boolean amenities
-        amenity_fields = [
-            'gym', 'swimming_pool', 'beach', 'medical_center', 'schools',
-            'shopping_malls', 'restaurants', 'marina', 'golf_course'
-        ]
-        
-        for field in amenity_fields:
-            if odoo_property.get(field):
-                amenities.append(field.replace('_', ' ').title())
-        
+        amenities = [label for field, label in _AMENITY_LABELS if get(field)]
+
         # Add facilities from many2many fields if available
-        if isinstance(odoo_property.get('facilities_ids'), (list, tuple)):
-            amenities.extend([str(f) for f in odoo_property['facilities_ids']])
-            
-        return ';'.join(amenities) if amenities else ''
+        facilities = get('facilities_ids')
+        if isinstance(facilities, (list, tuple)):
+            amenities.extend(map(str, facilities))
+
+        return ';'.join(amenities)
     
 class UnitMapper:
     """Maps Odoo property/unit fields to Zoho CRM fields based on exact Zoho field specifications"""
 
-    # Property type mapping based on account_asset.csv
-    PROPERTY_TYPE_MAPPING = {
-        'apartment': 'Apartment',
-        'villa': 'Villa',
-        'warehouse': 'Warehouse',
-        'commercial_villa': 'Commercial Villa',
-        'mixed_used_building': 'Mixed Used Building',
-        'commercial_building': 'Commercial Building',
-        'townhouse': 'Townhouse',
-        'plot': 'Residential Land',
-        'commercial_plot': 'Commercial Land',
-        'residential_building': 'Residential Building',
-        'retail': 'Retail',
-        'office': 'Office',
-        'labour_camp': 'Labour Camp',
-        'multiple_units': 'Bulk Units'
-    }
-    
-    # Bedroom mapping based on unit.bedrooms_unit_types.csv
-    BEDROOM_MAPPING = {
-        'Studio': 'Studio',
-        '0': '0',
-        '1': '1',
-        '2': '2',
-        '3': '3',
-        '4': '4',
-        '5': '5',
-        '6': '6',
-        '7': '7',
-        '8': '8',
-        'NULL': 'N/A',
-        'n/a': 'N/A'
-    }
-    
-    # Mapping for property status
-    PROPERTY_STATUS_MAPPING = {
-        'draft': 'Available',
-        'book': 'Reserved',
-        'normal': 'Leased',
-        'close': 'Sold',
-        'sold': 'Sold',
-        'cancel': 'Cancelled',
-        'block': 'Blocked',
-        'upcoming': 'Upcoming'
-    }
-    
-    # Mapping for property details (sale/rent)
-    PROPERTY_DETAILS_MAPPING = {
-        'sale': 'For Sale',
-        'rent': 'For Rent',
-        'both': 'None'
-    }
-
-    # Mapping for furnishing status
-    FURNISHING_MAPPING = {
-        'none': 'NO',
-        'semi_furnished': 'YES',
-        'full_furnished': 'YES'
-    }
+    PROPERTY_TYPE_MAPPING = _PROPERTY_TYPE_MAPPING
+    BEDROOM_MAPPING = _BEDROOM_MAPPING
+    PROPERTY_STATUS_MAPPING = _PROPERTY_STATUS_MAPPING
+    PROPERTY_DETAILS_MAPPING = _PROPERTY_DETAILS_MAPPING
+    FURNISHING_MAPPING = _FURNISHING_MAPPING
 
     @staticmethod
     def extract_relation_name(relation: Any) -> str:
         """Extract name from a many2one relation safely"""
-        if isinstance(relation, (list, tuple)) and len(relation) > 1:
-            return relation[1]
-        return ''
+        return _rel(relation)
 
     @staticmethod
     def map_unit(odoo_unit: Dict[str, Any],  is_update: bool = False) -> Optional[Dict[str, Any]]:
         """Map Odoo unit/property fields to Zoho CRM fields"""
-        try:
-            # Basic validation
-            if not odoo_unit.get('name'):
-                return None
-             # Check ownership type - only proceed if freehold or leashold
-            ownership_type = odoo_unit.get('ownership_type')
-            if ownership_type not in ['freehold', 'leashold']:
-                return None
-            
-            print(odoo_unit)
-            print('------------------------------------------------------------------------')
-            # print(odoo_unit.get('ref_no'))
-
-            # Get community and sub-community as text
-            community = UnitMapper.get_relation_name(odoo_unit.get('property_community_id'))
-            sub_community = UnitMapper.get_relation_name(odoo_unit.get('property_sub_community_id'))
-
-            zoho_unit = {
-                # Basic Unit Information
-                'Unit_Code': odoo_unit.get('property_code'),
-                'Property_Title': odoo_unit.get('name'),
-                'Unit_No': odoo_unit.get('unit_number'),
-                'Ref_No': odoo_unit.get('ref_no'),
-                
-                # Location Information - Converting dropdowns to text
-                'Locality': community,  # Using community as locality
-                'Sub_Locality': sub_community,  # Using sub-community as sub-locality
-                'City': UnitMapper.get_relation_name(odoo_unit.get('city_id')),
-                'State': UnitMapper.get_relation_name(odoo_unit.get('state_id')),
-                'Country': UnitMapper.get_relation_name(odoo_unit.get('country_id')),
-                
-                # Property Type and Status
-                'Unit_Types': UnitMapper.PROPERTY_TYPE_MAPPING.get(
-                    odoo_unit.get('type', '').lower(), 
-                    UnitMapper.get_relation_name(odoo_unit.get('unit_type_id'))
-                ),
-                'Status': odoo_unit.get('state'),
-                'Possession_Status': 'Under Construction' if odoo_unit.get('off_plan_property') else 'Ready',
-                
-                # Property Features
-                'Bedrooms': UnitMapper.BEDROOM_MAPPING.get(
-                    str(odoo_unit.get('bedroom', '')), 
-                    str(odoo_unit.get('bedroom', ''))
-                ),
-                'Bathrooms': str(odoo_unit.get('bathroom', '')),
-                'Floor_No': odoo_unit.get('floor_number'),
-                'Total_Area': odoo_unit.get('total_area'),
-                'Internal_Area_UOM': odoo_unit.get('builtup_area'),
-                'External_Area_UOM': odoo_unit.get('plot_area'),
-                
-                # Financial Information
-                'Unit_Sale_Price': UnitMapper.clean_currency(odoo_unit.get('selling_price')),
-                'Rent_Amount': UnitMapper.clean_currency(odoo_unit.get('rent_per_year')),
-                'Price_Per_UOM': UnitMapper.clean_currency(odoo_unit.get('price_per_sqt_foot')),
-                'Maintenance_fee': UnitMapper.clean_currency(odoo_unit.get('service_charge')),
-                'No_of_Cheques': odoo_unit.get('no_of_cheques'),
-                'Payment_Allocated': UnitMapper.clean_currency(odoo_unit.get('payment_allocated')),
-                'Total_Value': UnitMapper.clean_currency(odoo_unit.get('total_price')),
-                'Discount_Amount': UnitMapper.clean_currency(odoo_unit.get('discount')),
-                
-                # Dates and Timestamps
-                'Created_On': odoo_unit.get('create_date'),
-                'Listing_Date': odoo_unit.get('listing_date'),
-                
-                # Additional Details
-                'Property_Description': odoo_unit.get('marketing_desc'),
-                'Property_Description_AR': odoo_unit.get('marketing_desc_arabic'),
-                'Property_Title_AR': odoo_unit.get('name_arabic'),
-                'Permit_Number': odoo_unit.get('permit_number'),
-                'Geopoints': f"{odoo_unit.get('latitude', '')},{odoo_unit.get('longitude', '')}" if odoo_unit.get('latitude') and odoo_unit.get('longitude') else '',
-                
-                # Agent Information
-                'Agent_Name': odoo_unit.get('agent_name'),
-                'Agent_Email': odoo_unit.get('agent_email'),
-                'Agent_Phone': odoo_unit.get('agent_phone'),
-                'Agent_ID': odoo_unit.get('agent_id'),
-                
-                # Tracking Information
-                'Properties_Units_Id': f"odoo_{odoo_unit.get('id')}",
-                'Exchange_Rate': UnitMapper.clean_currency(odoo_unit.get('exchange_rate')),
-                'Currency': odoo_unit.get('currency', 'AED')
-            }
+        # Basic validation
+        if not odoo_unit.get('name'):
+            return None
+        # Check ownership type - only proceed if freehold or leashold
+        if odoo_unit.get('ownership_type') not in _VALID_OWNERSHIP:
+            return None
 
-            # Handle amenities and features
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("odoo_unit: %r", odoo_unit)
+
+        property_type_get = _PROPERTY_TYPE_MAPPING.get
+        bedroom_get = _BEDROOM_MAPPING.get
+        bedroom = str(odoo_unit.get('bedroom', ''))
+        latitude = odoo_unit.get('latitude')
+        longitude = odoo_unit.get('longitude')
+
+        # Only non-empty values are added to the payload
+        zoho_unit = {}
+        get = odoo_unit.get
+        for zoho_field, odoo_field, convert in _UNIT_FIELDS:
+            value = get(odoo_field)
+            if convert is not None:
+                value = convert(value)
+            if value not in (None, '', False):
+                zoho_unit[zoho_field] = value
+
+        # Derived fields
+        unit_types = property_type_get(
+            (odoo_unit.get('type') or '').lower(),
+            _rel(odoo_unit.get('unit_type_id'))
+        )
+        if unit_types:
+            zoho_unit['Unit_Types'] = unit_types
+        zoho_unit['Possession_Status'] = 'Under Construction' if odoo_unit.get('off_plan_property') else 'Ready'
+        bedrooms = bedroom_get(bedroom, bedroom)
+        if bedrooms:
+            zoho_unit['Bedrooms'] = bedrooms
+        bathrooms = str(odoo_unit.get('bathroom', ''))
+        if bathrooms:
+            zoho_unit['Bathrooms'] = bathrooms
+        if latitude and longitude:
+            zoho_unit['Geopoints'] = f"{latitude},{longitude}"
+        odoo_id = odoo_unit.get('id')
+        if odoo_id is not None:
+            zoho_unit['Properties_Units_Id'] = 'odoo_' + str(odoo_id)
+        currency = odoo_unit.get('currency', 'AED')
+        if currency not in (None, '', False):
+            zoho_unit['Currency'] = currency
+
+        # Handle amenities and features
+        try:
             if odoo_unit.get('amenities_ids'):
                 amenities = [am[1] for am in odoo_unit['amenities_ids'] if isinstance(am, (list, tuple))]
                 if amenities:
@@ -405,20 +447,19 @@ class UnitMapper:
                 comm_amenities = [am[1] for am in odoo_unit['commercial_amenities_ids'] if isinstance(am, (list, tuple))]
                 if comm_amenities:
                     zoho_unit['Commercial_Amenities'] = ';'.join(comm_amenities)
+        except (IndexError, TypeError) as e:
+            logger.error("Error mapping unit %s: %s", odoo_unit.get('name', 'Unknown'), e)
+            return None
 
-            print(zoho_unit)
-
-            
-            # Only include Unit_Code for new records
-            if not is_update:
-                zoho_unit['Unit_Code'] = odoo_unit.get('property_code')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("zoho_unit: %r", zoho_unit)
 
-            # Clean up empty values
-            return {k: v for k, v in zoho_unit.items() if v not in (None, '', False)}
+        # Only include Unit_Code for new records
+        unit_code = odoo_unit.get('property_code')
+        if not is_update and unit_code not in (None, '', False):
+            zoho_unit['Unit_Code'] = unit_code
 
-        except Exception as e:
-            print(f"Error mapping unit {odoo_unit.get('name', 'Unknown')}: {str(e)}")
-            return None
+        return zoho_unit
 
     @staticmethod
     def clean_currency(value: Any) -> Optional[float]:
@@ -427,7 +468,12 @@ class UnitMapper:
             if isinstance(value, (int, float)):
                 return float(value)
             elif isinstance(value, str):
-                cleaned = ''.join(c for c in value if c.isdigit() or c == '.')
+                # Remove currency symbols and commas
+                if value.isascii():
+                    cleaned = value.translate(_CURRENCY_DELETE_TABLE)
+                else:
+                    # str.isdigit, unlike the regex \d, also keeps superscripts, so '100m²' stays invalid
+                    cleaned = ''.join(c for c in value if c.isdigit() or c == '.')
                 return float(cleaned) if cleaned else None
             return None
         except (ValueError, TypeError):
@@ -436,9 +482,7 @@ class UnitMapper:
     @staticmethod
     def get_relation_name(relation: Any) -> str:
         """Extract name from a many2one relation tuple"""
-        if isinstance(relation, (list, tuple)) and len(relation) > 1:
-            return relation[1]
-        return ''
+        return _rel(relation)
 
     @staticmethod
     def format_geopoints(latitude: Any, longitude: Any) -> str:
@@ -455,10 +499,10 @@ class UnitMapper:
         """Generate a unique reference for the property"""
         ref_parts = []
         
-        if odoo_unit.get('ref_no'):
-            ref_parts.append(odoo_unit['ref_no'])
-        elif odoo_unit.get('property_code'):
+        if odoo_unit.get('property_code'):
             ref_parts.append(odoo_unit['property_code'])
+        elif odoo_unit.get('unit_number'):
+            ref_parts.append(odoo_unit['unit_number'])
             
         if odoo_unit.get('property_community_id'):
             ref_parts.append(odoo_unit['property_community_id'][1][:3].upper())
@@ -468,20 +512,6 @@ class UnitMapper:
             
         return '_'.join(ref_parts)
 
-    @staticmethod
-    def clean_currency(value: Any) -> Optional[float]:
-        """Clean and validate currency values"""
-        try:
-            if isinstance(value, (int, float)):
-                return float(value)
-            elif isinstance(value, str):
-                # Remove currency symbols and commas
-                cleaned = ''.join(c for c in value if c.isdigit() or c == '.')
-                return float(cleaned) if cleaned else None
-            return None
-        except (ValueError, TypeError):
-            return None
-
     @staticmethod
     def map_amenities(odoo_unit: Dict[str, Any]) -> list:
         """Extract and map amenities from Odoo unit"""
@@ -510,23 +540,74 @@ class UnitMapper:
                 
         return list(set(amenities))  # Remove duplicates
 
-    @staticmethod
-    def generate_reference(odoo_unit: Dict[str, Any]) -> str:
-        """Generate a unique reference for the property"""
-        ref_parts = []
-        
-        if odoo_unit.get('property_code'):
-            ref_parts.append(odoo_unit['property_code'])
-        elif odoo_unit.get('unit_number'):
-            ref_parts.append(odoo_unit['unit_number'])
-            
-        if odoo_unit.get('property_community_id'):
-            ref_parts.append(odoo_unit['property_community_id'][1][:3].upper())
-            
-        if not ref_parts:
-            ref_parts.append(f"PROP{datetime.now().strftime('%Y%m%d%H%M%S')}")
-            
-        return '_'.join(ref_parts)
+# Zoho fields copied straight from one Odoo field: (Zoho field, Odoo field, kind).
+# 'raw' copies the value, 'rel' takes a many2one name, 'currency' cleans a price.
+_UNIT_SCHEMA = (
+    # Basic Unit Information
+    ('Property_Title', 'name', 'raw'),
+    ('Unit_No', 'unit_number', 'raw'),
+    ('Ref_No', 'ref_no', 'raw'),
+
+    # Location Information - Converting dropdowns to text
+    ('Locality', 'property_community_id', 'rel'),
+    ('Sub_Locality', 'property_sub_community_id', 'rel'),
+    ('City', 'city_id', 'rel'),
+    ('State', 'state_id', 'rel'),
+    ('Country', 'country_id', 'rel'),
+
+    # Status
+    ('Status', 'state', 'raw'),
+
+    # Property Features
+    ('Floor_No', 'floor_number', 'raw'),
+    ('Total_Area', 'total_area', 'raw'),
+    ('Internal_Area_UOM', 'builtup_area', 'raw'),
+    ('External_Area_UOM', 'plot_area', 'raw'),
+
+    # Financial Information
+    ('Unit_Sale_Price', 'selling_price', 'currency'),
+    ('Rent_Amount', 'rent_per_year', 'currency'),
+    ('Price_Per_UOM', 'price_per_sqt_foot', 'currency'),
+    ('Maintenance_fee', 'service_charge', 'currency'),
+    ('No_of_Cheques', 'no_of_cheques', 'raw'),
+    ('Payment_Allocated', 'payment_allocated', 'currency'),
+    ('Total_Value', 'total_price', 'currency'),
+    ('Discount_Amount', 'discount', 'currency'),
+
+    # Dates and Timestamps
+    ('Created_On', 'create_date', 'raw'),
+    ('Listing_Date', 'listing_date', 'raw'),
+
+    # Additional Details
+    ('Property_Description', 'marketing_desc', 'raw'),
+    ('Property_Description_AR', 'marketing_desc_arabic', 'raw'),
+    ('Property_Title_AR', 'name_arabic', 'raw'),
+    ('Permit_Number', 'permit_number', 'raw'),
+
+    # Agent Information
+    ('Agent_Name', 'agent_name', 'raw'),
+    ('Agent_Email', 'agent_email', 'raw'),
+    ('Agent_Phone', 'agent_phone', 'raw'),
+    ('Agent_ID', 'agent_id', 'raw'),
+
+    # Tracking Information
+    ('Exchange_Rate', 'exchange_rate', 'currency'),
+)
+
+# _UNIT_SCHEMA with each kind resolved to its converter once, at import
+_UNIT_CONVERTERS = {'raw': None, 'rel': _rel, 'currency': UnitMapper.clean_currency}
+_UNIT_FIELDS = tuple(
+    (zoho_field, odoo_field, _UNIT_CONVERTERS[kind])
+    for zoho_field, odoo_field, kind in _UNIT_SCHEMA
+)
+
+# record_type -> mapper used by DataMapper.map_record
+_RECORD_MAPPERS = MappingProxyType({
+    'contact': ContactMapper.map_contact,
+    'lead': LeadMapper.map_lead,
+    'property': PropertyMapper.map_property,
+    'unit': UnitMapper.map_unit,
+})
 
 class DataMapper:
     contact_mapper = ContactMapper()
@@ -535,10 +616,7 @@ class DataMapper:
     @staticmethod
     def map_record(odoo_record: Dict[str, Any], record_type: str) -> Optional[Dict[str, Any]]:
         """Map Odoo records based on type"""
-        print('odoo_record:             ', odoo_record)
-        print('---------------------------------------')
-        if record_type == 'contact':
-            return ContactMapper.map_contact(odoo_record)
-        elif record_type == 'property':
-            return PropertyMapper.map_property(odoo_record)
-        return None
\ No newline at end of file
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("odoo_record: %r", odoo_record)
+        mapper = _RECORD_MAPPERS.get(record_type)
+        return mapper(odoo_record) if mapper else None
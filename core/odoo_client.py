@@ -114,26 +114,78 @@
 
 
 
-import xmlrpc.client
-from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import json
+import random
+import sys
+from typing import Dict, Iterator, List, Any
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 import time
 from tqdm import tqdm
 import logging
-from collections import deque
 import threading
+import requests
+from config.settings import ODOO_TIMEOUT
+from utils.concurrency import iter_completed
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json
+    orjson = None
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+class _JsonRpcConnection:
+    """Odoo's /jsonrpc endpoint for one service, called like an xmlrpc ServerProxy"""
+
+    def __init__(self, url: str, service: str, timeout=ODOO_TIMEOUT):
+        self.url = f'{url}/jsonrpc'
+        self.service = service
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def _call(self, method: str, *args) -> Any:
+        payload = {
+            'jsonrpc': '2.0',
+            'method': 'call',
+            'params': {'service': self.service, 'method': method, 'args': args},
+            'id': 1
+        }
+        body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+        response = self.session.post(self.url, data=body, headers=_JSON_HEADERS, timeout=self.timeout)
+        response.raise_for_status()
+        result = orjson.loads(response.content) if orjson is not None else json.loads(response.content)
+
+        error = result.get('error')
+        if error:
+            # Server-side exceptions carry the useful message in data, the generic one at the top
+            raise Exception((error.get('data') or {}).get('message') or error.get('message'))
+        return result.get('result')
+
+    def authenticate(self, *args):
+        return self._call('authenticate', *args)
+
+    def execute_kw(self, *args):
+        return self._call('execute_kw', *args)
+
+    def close(self):
+        self.session.close()
 
 class OdooClient:
-    def __init__(self, config: Dict[str, str], max_workers: int = 4, retry_limit: int = 3):
+    # Upper bound for the auto-grown batch size so a single search_read stays well under request timeouts
+    MAX_BATCH_SIZE = 2000
+    # Seconds a per-thread connection may sit unused before its socket is closed and rebuilt
+    IDLE_TIMEOUT = 60
+
+    def __init__(self, config: Dict[str, str], max_workers: int = 2, retry_limit: int = 3):
+        # max_workers is the number of batches in flight; fewer, larger batches let Odoo's ORM
+        # and PostgreSQL work on bigger reads. Pass max_workers=4 for high-latency remote servers.
         self.logger = self._setup_logger()
         self.config = config
         self.uid = None
-        self.models = None
         self.max_workers = max_workers
         self.retry_limit = retry_limit
-        self._connection_lock = threading.Lock()
-        self._connection_pool = deque(maxlen=max_workers)
+        self._local = threading.local()
         self.connect()
 
     def _setup_logger(self):
@@ -147,126 +199,196 @@ class OdooClient:
         return logger
 
     def _create_connection(self):
-        """Create a new XML-RPC connection"""
-        models = xmlrpc.client.ServerProxy(
-            f'{self.config["url"]}/xmlrpc/2/object',
-            allow_none=True,
-            use_datetime=True,
-            use_builtin_types=True
-        )
-        return models
+        """Create a new JSON-RPC connection"""
+        # JSON-RPC instead of XML-RPC: record payloads are smaller and far cheaper to encode and decode
+        return _JsonRpcConnection(self.config["url"], 'object')
 
     def connect(self):
-        """Connect to Odoo using XML-RPC with connection pooling"""
+        """Connect to Odoo using JSON-RPC"""
         try:
-            common = xmlrpc.client.ServerProxy(f'{self.config["url"]}/xmlrpc/2/common')
+            common = _JsonRpcConnection(self.config["url"], 'common')
             self.uid = common.authenticate(
                 self.config['db'],
                 self.config['username'],
                 self.config['password'],
                 {}
             )
-            
-            # Initialize connection pool
-            for _ in range(self.max_workers):
-                self._connection_pool.append(self._create_connection())
-            
-            self.models = self._connection_pool[0]  # Keep one connection as default
-            self.logger.info("Successfully connected to Odoo and initialized connection pool")
+            common.close()
+
+            self.logger.info("Successfully connected to Odoo")
         except Exception as e:
             self.logger.error(f"Failed to connect to Odoo: {str(e)}")
             raise
 
-    def _get_connection(self):
-        """Get a connection from the pool"""
-        with self._connection_lock:
-            if not self._connection_pool:
-                return self._create_connection()
-            return self._connection_pool.popleft()
+    @property
+    def models(self):
+        """The calling thread's object-service connection"""
+        # Counting, searching and odoo_inspector calls may come from any thread, so they go
+        # through the per-thread connection just like the batch fetches
+        return self._get_connection()
 
-    def _return_connection(self, connection):
-        """Return a connection to the pool"""
-        with self._connection_lock:
-            self._connection_pool.append(connection)
+    def _get_connection(self):
+        """Get this thread's connection, creating it on first use"""
+        # A requests.Session is not safe to share; one per worker thread keeps its keep-alive
+        # socket across batches without a shared pool or lock
+        now = time.monotonic()
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None and now - self._local.last_used > self.IDLE_TIMEOUT:
+            # The server may already have dropped an idle keep-alive socket
+            connection.close()
+            connection = None
+        if connection is None:
+            connection = self._local.connection = self._create_connection()
+        self._local.last_used = now
+        return connection
 
     def _fetch_batch(self, model: str, fields: List[str], domain: List, batch_info: dict) -> List[Dict[str, Any]]:
         """Fetch a single batch of records with retry logic"""
-        connection = self._get_connection()
-        try:
-            offset, limit = batch_info['offset'], batch_info['limit']
-            
-            # Fetch record IDs
-            record_ids = connection.execute_kw(
-                self.config['db'], self.uid, self.config['password'],
-                model, 'search',
-                [domain],
-                {
-                    'offset': offset,
-                    'limit': limit,
-                    'order': 'id'
-                }
-            )
-            
-            if not record_ids:
-                return []
-            
-            # Fetch actual records
-            records = connection.execute_kw(
-                self.config['db'], self.uid, self.config['password'],
-                model, 'read',
-                [record_ids],
-                {'fields': fields}
-            )
-            
-            return records
-        except Exception as e:
-            self.logger.warning(f"Error in batch {batch_info['offset']}: {str(e)}")
-            raise
-        finally:
-            self._return_connection(connection)
+        after, upto = batch_info['after'], batch_info['upto']
+
+        for attempt in range(self.retry_limit + 1):
+            connection = self._get_connection()
+            try:
+                # Keyset page: an id range instead of an OFFSET the database has to skip
+                records = connection.execute_kw(
+                    self.config['db'], self.uid, self.config['password'],
+                    model, 'search_read',
+                    [domain + [('id', '>', after), ('id', '<=', upto)]],
+                    {
+                        'fields': fields,
+                        'limit': batch_info['limit'],
+                        'order': 'id'
+                    }
+                )
+
+                return records
+            except (requests.RequestException, OSError) as e:
+                # Transport errors and timeouts are transient; back off with jitter and retry
+                if attempt == self.retry_limit:
+                    self.logger.warning(f"Error in batch {after}-{upto}: {str(e)}")
+                    raise
+                delay = random.uniform(0.1, 0.5) * 2 ** attempt
+                self.logger.warning(f"Error in batch {after}-{upto}, retrying in {delay:.1f}s: {str(e)}")
+                time.sleep(delay)
+            except Exception as e:
+                self.logger.warning(f"Error in batch {after}-{upto}: {str(e)}")
+                raise
+
+    def _field_types(self, model: str, fields: List[str]) -> Dict[str, str]:
+        """Return the Odoo type of each requested field"""
+        field_info = self.models.execute_kw(
+            self.config['db'], self.uid, self.config['password'],
+            model, 'fields_get', [fields], {'attributes': ['type']}
+        )
+        return {name: info.get('type') for name, info in field_info.items()}
+
+    @staticmethod
+    def _intern_values(records: List[Dict[str, Any]], relation_fields: List[str],
+                       selection_fields: List[str], relations: Dict) -> None:
+        """Share repeated many2one and selection values across records"""
+        for record in records:
+            # One (id, name) tuple per distinct related record
+            for field in relation_fields:
+                value = record.get(field)
+                if value:
+                    key = (field, value[0])
+                    shared = relations.get(key)
+                    if shared is None:
+                        # A related record without a display name comes back as [id, False]
+                        name = value[1]
+                        if isinstance(name, str):
+                            name = sys.intern(name)
+                        shared = relations[key] = (value[0], name)
+                    record[field] = shared
+            # Selection keys come from a short fixed list
+            for field in selection_fields:
+                value = record.get(field)
+                if value and isinstance(value, str):
+                    record[field] = sys.intern(value)
+
+    def count_records(self, model: str, domain: List = None) -> int:
+        """Count the records matching domain without fetching them"""
+        return self.models.execute_kw(
+            self.config['db'], self.uid, self.config['password'],
+            model, 'search_count', [domain or []]
+        )
+
+    def iter_records(self, model: str, fields: List[str] = None, domain: List = None,
+                     batch_size: int = 200, ids_only: bool = False) -> Iterator[List[Dict[str, Any]]]:
+        """Yield batches of Odoo records as soon as each one is fetched"""
+        if domain is None:
+            domain = []
+        if fields is None:
+            fields = []
+        if fields == ['id']:
+            ids_only = True
+        elif not fields and not ids_only:
+            self.logger.warning(f"No fields requested for {model}; Odoo will return every column")
+
+        # Get the matching ids once; they double as the count and the page boundaries
+        record_ids = self.models.execute_kw(
+            self.config['db'], self.uid, self.config['password'],
+            model, 'search', [domain], {'order': 'id'}
+        )
+        total_count = len(record_ids)
+
+        if total_count == 0:
+            return
+
+        self.logger.info(f"Total records to fetch: {total_count}")
+
+        # The search already returned every id, so id-only callers need no read at all
+        if ids_only:
+            for i in range(0, total_count, batch_size):
+                yield [{'id': record_id} for record_id in record_ids[i:i + batch_size]]
+            return
+
+        # Grow small batches on large fetches so there are about 8 batches per worker
+        batch_size = max(batch_size, min(total_count // (self.max_workers * 8), self.MAX_BATCH_SIZE))
+
+        # Prepare batches as (after, upto] id ranges
+        batches = [
+            {
+                'after': record_ids[i - 1] if i else 0,
+                'upto': record_ids[min(i + batch_size, total_count) - 1],
+                'limit': batch_size
+            }
+            for i in range(0, total_count, batch_size)
+        ]
+
+        fetch_fn = partial(self._fetch_batch, model, fields, domain)
+
+        # Many2one and selection values repeat across rows; share them instead of keeping a copy per row
+        field_types = self._field_types(model, fields)
+        relation_fields = [name for name, field_type in field_types.items() if field_type == 'many2one']
+        selection_fields = [name for name, field_type in field_types.items() if field_type == 'selection']
+        relations = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Sliding window: keep max_workers batches in flight and submit the next one as each
+            # completes, so unconsumed results never exceed the window
+            completed = iter_completed(executor, fetch_fn, batches, self.max_workers)
+
+            with tqdm(total=total_count, desc=f"Fetching {model} records", unit="records") as pbar:
+                for _, future in completed:
+                    try:
+                        batch_records = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Batch processing error: {str(e)}")
+                        continue
+                    if batch_records:
+                        if relation_fields or selection_fields:
+                            self._intern_values(batch_records, relation_fields, selection_fields, relations)
+                        pbar.update(len(batch_records))
+                        yield batch_records
 
     def fetch_records(self, model: str, fields: List[str] = None, domain: List = None, 
-                     batch_size: int = 200) -> List[Dict[str, Any]]:
+                     batch_size: int = 200, ids_only: bool = False) -> List[Dict[str, Any]]:
         """Fetch records from Odoo using parallel processing"""
         try:
-            if domain is None:
-                domain = []
-            if fields is None:
-                fields = []
-
-            # Get total count
-            total_count = self.models.execute_kw(
-                self.config['db'], self.uid, self.config['password'],
-                model, 'search_count', [domain]
-            )
-            
-            if total_count == 0:
-                return []
-
-            self.logger.info(f"Total records to fetch: {total_count}")
-            
-            # Prepare batches
-            batches = [
-                {'offset': i, 'limit': batch_size}
-                for i in range(0, total_count, batch_size)
-            ]
-            
             all_records = []
-            fetch_fn = partial(self._fetch_batch, model, fields, domain)
-            
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = [executor.submit(fetch_fn, batch) for batch in batches]
-                
-                with tqdm(total=total_count, desc=f"Fetching {model} records", unit="records") as pbar:
-                    for future in as_completed(futures):
-                        try:
-                            batch_records = future.result()
-                            if batch_records:
-                                all_records.extend(batch_records)
-                                pbar.update(len(batch_records))
-                        except Exception as e:
-                            self.logger.error(f"Batch processing error: {str(e)}")
-                            continue
+            for batch_records in self.iter_records(model, fields, domain, batch_size, ids_only):
+                all_records.extend(batch_records)
 
             self.logger.info(f"Successfully fetched {len(all_records)} records from Odoo")
             return all_records
@@ -1,18 +1,78 @@
 # core/zoho_client.py
 
+import json
+import logging
+import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 import time
-from typing import Dict, Any, Set, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, Iterable, Iterator, List, Set, Optional
 from threading import Lock
 from tqdm import tqdm
+from config.settings import ZOHO_TIMEOUT
 from utils.logger import setup_logger
+from utils.rate_limiter import TokenBucket
+from utils.validators import DataValidator
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json used by requests
+    orjson = None
+
+# Sent with orjson-encoded bodies; shared because requests copies it when merging with the session headers
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Parentheses and commas are criteria syntax, so Zoho requires them backslash-escaped inside values
+_CRITERIA_ESCAPES = str.maketrans({'\\': '\\\\', '(': '\\(', ')': '\\)', ',': '\\,'})
+
+def _criteria_value(value: Any) -> str:
+    """Escape a value for use in a Zoho search criteria string"""
+    return str(value).translate(_CRITERIA_ESCAPES)
+
+def _never_sent(error: requests.RequestException) -> bool:
+    """Whether a request failed before reaching Zoho, so sending it again cannot duplicate it"""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+def _parse_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 class ZohoClient:
-    def __init__(self, config: Dict[str, str]):
+    # Contact pages requested concurrently per wave when paging through the whole module
+    PAGE_WORKERS = 8
+    # Zoho's insert API accepts at most this many records per request
+    MAX_RECORDS_PER_REQUEST = 100
+    # Retries for a request rejected with 401, 429 or a 5xx status
+    MAX_RETRIES = 3
+    # Values allowed in a single COQL "in" clause
+    COQL_IN_LIMIT = 50
+    # Rows COQL returns per query on the v2 API; larger results are paged with an offset
+    COQL_PAGE_SIZE = 200
+    # Remembers which data center accepted the refresh token so later runs try it first
+    DOMAIN_CACHE_PATH = os.path.expanduser('~/.zoho_migrator_domain')
+
+    def __init__(self, config: Dict[str, str], pool_maxsize: int = 10, requests_per_second: float = 10.0):
         self.logger = setup_logger(__name__)
         self.config = config
         self.access_token = None
+        self._token_expires_at = 0.0
         self.token_lock = Lock()
+        # One session for every call so urllib3 keeps the TLS connection alive between requests
+        self.session = requests.Session()
+        # Size the pool to the worker count so concurrent threads do not discard connections
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Shared by all worker threads; retuned from Zoho's rate-limit headers as responses arrive
+        self.rate_limiter = TokenBucket(requests_per_second, burst=pool_maxsize)
         
         # Try different Zoho domains
         self.domains = [
@@ -34,9 +94,29 @@ class ZohoClient:
             }
         ]
         
-        self.current_domain = None
+        self.current_domain = self._load_cached_domain()
         self.refresh_token()
 
+    def _load_cached_domain(self) -> Optional[Dict[str, str]]:
+        """Return the domain saved by a previous run, if it is still a known one"""
+        try:
+            with open(self.DOMAIN_CACHE_PATH) as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        for domain in self.domains:
+            if domain == cached:
+                return domain
+        return None
+
+    def _save_cached_domain(self, domain: Dict[str, str]):
+        """Persist the working domain for the next run"""
+        try:
+            with open(self.DOMAIN_CACHE_PATH, 'w') as f:
+                json.dump(domain, f)
+        except OSError as e:
+            self.logger.debug("Could not cache Zoho domain: %s", e)
+
     def try_refresh_token(self, domain: Dict[str, str]) -> bool:
         """Try to refresh token with a specific domain"""
         try:
@@ -47,15 +127,18 @@ class ZohoClient:
                 'grant_type': 'refresh_token'
             }
             
-            self.logger.debug(f"Attempting to refresh token with domain {domain['auth_url']}")
-            self.logger.debug(f"Request data: {data}")
+            self.logger.debug("Attempting to refresh token with domain %s", domain['auth_url'])
             
-            response = requests.post(domain['auth_url'], data=data)
-            self.logger.debug(f"Response status: {response.status_code}")
-            self.logger.debug(f"Response content: {response.text}")
+            # The auth server must not receive the (possibly expired) API token
+            response = self.session.post(domain['auth_url'], data=data, headers={'Authorization': None},
+                                         timeout=ZOHO_TIMEOUT)
+            self.logger.debug("Response status: %s", response.status_code)
             
-            if response.status_code == 200 and 'access_token' in response.json():
-                self.access_token = response.json()['access_token']
+            token_data = _parse_json(response) if response.status_code == 200 else {}
+            if 'access_token' in token_data:
+                self._set_token(token_data['access_token'], float(token_data.get('expires_in', 3600)))
+                if domain is not self.current_domain:
+                    self._save_cached_domain(domain)
                 self.current_domain = domain
                 self.logger.info(f"Successfully refreshed token with domain {domain['auth_url']}")
                 return True
@@ -66,10 +149,23 @@ class ZohoClient:
             self.logger.debug(f"Failed to refresh token with domain {domain['auth_url']}: {str(e)}")
             return False
 
-    def refresh_token(self):
-        """Try to refresh token with all available domains"""
+    def _set_token(self, access_token: str, expires_in: float):
+        """Store a new access token on the session so every request picks it up"""
+        self.access_token = access_token
+        self._token_expires_at = time.monotonic() + expires_in
+        self.session.headers['Authorization'] = f'Zoho-oauthtoken {access_token}'
+
+    def refresh_token(self, stale_auth: Optional[str] = None):
+        """Try to refresh token, starting with the domain that worked last"""
         with self.token_lock:
-            for domain in self.domains:
+            # Another thread may have refreshed the token while this one waited for the lock
+            if stale_auth is not None and self.session.headers.get('Authorization') != stale_auth:
+                return
+
+            domains = self.domains
+            if self.current_domain:
+                domains = [self.current_domain] + [d for d in self.domains if d is not self.current_domain]
+            for domain in domains:
                 if self.try_refresh_token(domain):
                     return
                     
@@ -77,79 +173,180 @@ class ZohoClient:
             self.logger.error(error_msg)
             raise Exception(error_msg)
 
-    def create_record(self, module: str, data: Dict[str, Any], retry_count: int = 0) -> Optional[Dict[str, Any]]:
+    def _send(self, method: str, url: str, idempotent: Optional[bool] = None, **kwargs) -> requests.Response:
+        """Send an API request with a bounded retry loop: refresh the token on 401, back off on
+        429/5xx and connection errors, return anything else
+
+        Only idempotent requests (GET and PUT by default) are resent after a 5xx or a dropped
+        connection; Zoho may already have committed a POST create, so those are resent only
+        when it provably never arrived"""
+        if idempotent is None:
+            idempotent = method in ('GET', 'PUT')
+        kwargs.setdefault('timeout', ZOHO_TIMEOUT)
+        if orjson is not None and 'json' in kwargs:
+            kwargs['data'] = orjson.dumps(kwargs.pop('json'))
+            kwargs['headers'] = _JSON_HEADERS
+        for attempt in range(self.MAX_RETRIES + 1):
+            self._ensure_token()
+            self.rate_limiter.acquire()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.MAX_RETRIES or not (idempotent or _never_sent(e)):
+                    raise
+                delay = 0.5 * 2 ** attempt
+                self.logger.warning(f"Zoho request failed, retrying in {delay}s: {str(e)}")
+                time.sleep(delay)
+                continue
+            self.rate_limiter.update_from_headers(response.headers)
+            if attempt == self.MAX_RETRIES:
+                return response
+
+            if response.status_code == 401:
+                self.refresh_token(response.request.headers.get('Authorization'))
+            elif response.status_code == 429:
+                # The quota is shared, so pause every thread rather than just this one;
+                # the next acquire() waits out the penalty
+                delay = self._retry_delay(response, attempt)
+                self.logger.warning(f"Zoho returned 429, pausing requests for {delay}s")
+                self.rate_limiter.penalize(delay)
+            elif response.status_code >= 500 and idempotent:
+                delay = self._retry_delay(response, attempt)
+                self.logger.warning(f"Zoho returned {response.status_code}, retrying in {delay}s")
+                time.sleep(delay)
+            else:
+                return response
+
+    @staticmethod
+    def _retry_delay(response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retrying: Retry-After when Zoho sends one, else exponential backoff"""
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        return 0.5 * 2 ** attempt
+
+    def _ensure_token(self):
+        """Refresh the access token shortly before it expires"""
+        if time.monotonic() >= self._token_expires_at - 60:
+            self.refresh_token(self.session.headers.get('Authorization'))
+
+    def create_record(self, module: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create a record in Zoho CRM"""
-        # try:
         if not self.current_domain:
             raise Exception("No valid Zoho domain found")
             
         url = f"{self.current_domain['base_url']}/{module}"
-        headers = {
-            'Authorization': f'Zoho-oauthtoken {self.access_token}',
-            'Content-Type': 'application/json'
-        }
         
         payload = {'data': [data]}
-        response = requests.post(url, headers=headers, json=payload)
-        
-        if response.status_code == 401 and retry_count < 3:
-            self.refresh_token()
-            return self.create_record(module, data, retry_count + 1)
+        response = self._send('POST', url, json=payload)
             
-        response_data = response.json()
+        response_data = _parse_json(response)
         return response_data
-            
-        # except Exception as e:
-        #     self.logger.error(f"Error creating Zoho record: {str(e)}")
-        #     if retry_count < 3:
-        #         time.sleep(1)
-        #         return self.create_record(module, data, retry_count + 1)
-        #     return None
+
+    def create_records(self, module: str, data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Create records in Zoho CRM, sending up to 100 per request; returns one result per record"""
+        return self._write_records('POST', module, data_list)
+
+    def update_records(self, module: str, data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Update records in Zoho CRM, each identified by its 'id'; returns one result per record"""
+        return self._write_records('PUT', module, data_list)
+
+    def _write_records(self, method: str, module: str, data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Send records to the module endpoint in chunks of MAX_RECORDS_PER_REQUEST"""
+        if not self.current_domain:
+            raise Exception("No valid Zoho domain found")
+
+        url = f"{self.current_domain['base_url']}/{module}"
+        results = []
+
+        for i in range(0, len(data_list), self.MAX_RECORDS_PER_REQUEST):
+            chunk = data_list[i:i + self.MAX_RECORDS_PER_REQUEST]
+
+            try:
+                response = self._send(method, url, json={'data': chunk})
+                response_data = _parse_json(response)
+            except Exception as e:
+                # Only this chunk failed; earlier chunks were written and keep their results
+                self.logger.error(f"Error writing {module} records {i}-{i + len(chunk) - 1}: {str(e)}")
+                response_data = {'status': 'error', 'message': str(e)}
+            chunk_results = response_data.get('data') or []
+            if len(chunk_results) != len(chunk):
+                # The request failed as a whole; report the response against every record
+                chunk_results = [response_data] * len(chunk)
+            results.extend(chunk_results)
+
+        return results
+
+    def _get_contacts_page(self, page: int, fields: str) -> Dict[str, Any]:
+        """Fetch a single page of contacts"""
+        url = f"{self.current_domain['base_url']}/Contacts"
+        params = {
+            'page': page,
+            'per_page': 200,
+            'fields': fields
+        }
+
+        response = self._send('GET', url, params=params)
+        if response.status_code == 204:  # No content past the last page
+            return {}
+        return _parse_json(response)
+
+    def _iter_contact_pages(self, fields: str, desc: str) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of contacts in order, fetching them in concurrent waves after the first"""
+        if not self.current_domain:
+            raise Exception("No valid Zoho domain found")
+
+        fetch_page = partial(self._get_contacts_page, fields=fields)
+        with tqdm(desc=desc, unit="page") as pbar:
+            data = fetch_page(1)
+            if not data.get('data'):
+                return
+            yield data['data']
+            pbar.update(1)
+            # Zoho flags the last page itself, so no request is spent on an empty one
+            if not data.get('info', {}).get('more_records'):
+                return
+
+            page = 2
+            with ThreadPoolExecutor(max_workers=self.PAGE_WORKERS) as executor:
+                while True:
+                    for data in executor.map(fetch_page, range(page, page + self.PAGE_WORKERS)):
+                        if not data.get('data'):
+                            return
+                        yield data['data']
+                        pbar.update(1)
+                        if not data.get('info', {}).get('more_records'):
+                            return
+                    page += self.PAGE_WORKERS
 
     def get_contact_map(self) -> Dict[str, str]:
         """Fetch all contacts and create a mapping of mobile/email to Zoho contact ID"""
         self.logger.info("Building contact mapping...")
         contact_map = {}
-        page = 1
-        
-        with tqdm(desc="Fetching contacts for mapping", unit="page") as pbar:
-            while True:
-                try:
-                    if not self.current_domain:
-                        raise Exception("No valid Zoho domain found")
-                        
-                    url = f"{self.current_domain['base_url']}/Contacts"
-                    headers = {
-                        'Authorization': f'Zoho-oauthtoken {self.access_token}',
-                    }
-                    params = {
-                        'page': page,
-                        'per_page': 200,
-                        'fields': 'id,Mobile,Email'
-                    }
-                    
-                    response = requests.get(url, headers=headers, params=params)
-                    if response.status_code == 401:
-                        self.refresh_token()
-                        continue
-                        
-                    data = response.json()
-                    
-                    if not data.get('data'):
-                        break
-                        
-                    for contact in data['data']:
-                        if contact.get('Mobile'):
-                            contact_map[contact['Mobile']] = contact['id']
-                        if contact.get('Email'):
-                            contact_map[contact['Email']] = contact['id']
-                    
-                    page += 1
-                    pbar.update(1)
-                    
-                except Exception as e:
-                    self.logger.error(f"Error fetching contacts page {page}: {str(e)}")
-                    break
+        normalize_phone = DataValidator.normalize_phone
+        normalize_email = DataValidator.normalize_email
+
+        try:
+            for contacts in self._iter_contact_pages('id,Mobile,Email', "Fetching contacts for mapping"):
+                for contact in contacts:
+                    # Raw values plus normalized keys, so differently formatted numbers still match
+                    mobile = contact.get('Mobile')
+                    if mobile:
+                        contact_map[mobile] = contact['id']
+                        mobile_key = normalize_phone(mobile)
+                        if mobile_key:
+                            contact_map[mobile_key] = contact['id']
+                    email = contact.get('Email')
+                    if email:
+                        contact_map[email] = contact['id']
+                        email_key = normalize_email(email)
+                        if email_key:
+                            contact_map[email_key] = contact['id']
+        except Exception as e:
+            self.logger.error(f"Error fetching contacts: {str(e)}")
 
         self.logger.info(f"Built mapping for {len(contact_map)} contacts")
         return contact_map
@@ -158,44 +355,14 @@ class ZohoClient:
         """Fetch existing contacts from Zoho"""
         self.logger.info("Fetching existing contacts from Zoho...")
         existing_contacts = set()
-        page = 1
-        
-        with tqdm(desc="Fetching existing contacts", unit="page") as pbar:
-            while True:
-                try:
-                    if not self.current_domain:
-                        raise Exception("No valid Zoho domain found")
-                        
-                    url = f"{self.current_domain['base_url']}/Contacts"
-                    headers = {
-                        'Authorization': f'Zoho-oauthtoken {self.access_token}',
-                    }
-                    params = {
-                        'page': page,
-                        'per_page': 200,
-                        'fields': 'First_Name,Last_Name,Mobile'
-                    }
-                    
-                    response = requests.get(url, headers=headers, params=params)
-                    if response.status_code == 401:
-                        self.refresh_token()
-                        continue
-                        
-                    data = response.json()
-                    
-                    if not data.get('data'):
-                        break
-                        
-                    for contact in data['data']:
-                        if contact.get('Mobile'):
-                            existing_contacts.add(contact['Mobile'])
-                    
-                    page += 1
-                    pbar.update(1)
-                    
-                except Exception as e:
-                    self.logger.error(f"Error fetching existing contacts page {page}: {str(e)}")
-                    break
+
+        try:
+            for contacts in self._iter_contact_pages('Mobile', "Fetching existing contacts"):
+                for contact in contacts:
+                    if contact.get('Mobile'):
+                        existing_contacts.add(contact['Mobile'])
+        except Exception as e:
+            self.logger.error(f"Error fetching existing contacts: {str(e)}")
 
         self.logger.info(f"Found {len(existing_contacts)} existing contacts in Zoho")
         return existing_contacts
@@ -204,14 +371,11 @@ class ZohoClient:
         try:
             # Make a request to list all modules
             url = f"{self.current_domain['base_url']}/settings/modules"
-            headers = {
-                'Authorization': f'Zoho-oauthtoken {self.access_token}'
-            }
             
-            response = requests.get(url, headers=headers)
+            response = self._send('GET', url)
             
             if response.status_code == 200:
-                modules = response.json()
+                modules = _parse_json(response)
                 self.logger.info("Available Zoho CRM modules:")
                 for module in modules.get('modules', []):
                     self.logger.info(f"API Name: {module.get('api_name')} - Display Name: {module.get('module_name')}")
@@ -223,6 +387,52 @@ class ZohoClient:
         except Exception as e:
             self.logger.error(f"Error checking modules: {str(e)}")
             return None
+
+    def _coql(self, query: str) -> List[Dict[str, Any]]:
+        """Run a COQL select query and return every matching record, paging until Zoho has no more"""
+        if not self.current_domain:
+            raise Exception("No valid Zoho domain found")
+
+        url = f"{self.current_domain['base_url']}/coql"
+        records = []
+        offset = 0
+        while True:
+            page_query = f"{query} limit {offset}, {self.COQL_PAGE_SIZE}"
+            # A COQL query only reads, so it is safe to resend despite being a POST
+            response = self._send('POST', url, idempotent=True, json={'select_query': page_query})
+            if response.status_code == 204:  # No matching records
+                break
+            if response.status_code != 200:
+                raise Exception(f"COQL query failed with status {response.status_code}: {response.text}")
+            data = _parse_json(response)
+            records.extend(data.get('data', []))
+            if not data.get('info', {}).get('more_records'):
+                break
+            offset += self.COQL_PAGE_SIZE
+        return records
+
+    def _coql_lookup(self, module: str, columns: str, key_field: str, values: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch records whose key_field is one of values, in chunks of COQL_IN_LIMIT"""
+        values = list(dict.fromkeys(str(value) for value in values))
+        records = {}
+        for i in range(0, len(values), self.COQL_IN_LIMIT):
+            chunk = values[i:i + self.COQL_IN_LIMIT]
+            quoted = ', '.join("'" + value.replace("'", "\\'") + "'" for value in chunk)
+            # No per-key limit: a key may match several records, and capping the rows would drop other keys.
+            # Ordered by id so pages are stable; with duplicates the first (oldest) record wins, as data[0] did
+            query = f"select {columns} from {module} where {key_field} in ({quoted}) order by id"
+            for record in self._coql(query):
+                records.setdefault(str(record.get(key_field)), record)
+        return records
+
+    def get_contacts_by_odoo_ids(self, odoo_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Find contacts for many Odoo IDs at once; returns Odoo_ID -> contact"""
+        return self._coql_lookup('Contacts', 'id, Odoo_ID, Owner', 'Odoo_ID', odoo_ids)
+
+    def get_existing_units(self, unit_codes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Find existing units for many Unit_Codes at once; returns Unit_Code -> unit"""
+        return self._coql_lookup('CustomModule1', 'id, Unit_Code', 'Unit_Code', unit_codes)
+
     def get_existing_unit(self, unit_code: str) -> Optional[Dict[str, Any]]:
         """Find existing unit by Unit_Code"""
         try:
@@ -230,22 +440,17 @@ class ZohoClient:
                 raise Exception("No valid Zoho domain found")
                 
             url = f"{self.current_domain['base_url']}/CustomModule1/search"
-            headers = {
-                'Authorization': f'Zoho-oauthtoken {self.access_token}',
-            }
             
             # Search criteria
             params = {
-                'criteria': f'(Unit_Code:equals:{unit_code})'
+                'criteria': f'(Unit_Code:equals:{_criteria_value(unit_code)})'
             }
             
-            response = requests.get(url, headers=headers, params=params)
-            
-            if response.status_code == 401:
-                self.refresh_token()
-                return self.get_existing_unit(unit_code)
+            response = self._send('GET', url, params=params)
+            if response.status_code == 204:  # No match
+                return None
                 
-            data = response.json()
+            data = _parse_json(response)
             if data.get('data'):
                 return data['data'][0]
             return None
@@ -260,28 +465,22 @@ class ZohoClient:
             raise Exception("No valid Zoho domain found")
             
         url = f"{self.current_domain['base_url']}/Contacts/search"
-        headers = {
-            'Authorization': f'Zoho-oauthtoken {self.access_token}',
-            'Content-Type': 'application/json'  # Add content type header
-        }
         
         params = {
-            'criteria': f'(Odoo_ID:equals:{odoo_id})'
+            'criteria': f'(Odoo_ID:equals:{_criteria_value(odoo_id)})'
         }
         
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self._send('GET', url, params=params)
             
-            # Log response details for debugging
-            self.logger.debug(f"Response status code: {response.status_code}")
-            self.logger.debug(f"Response headers: {response.headers}")
-            self.logger.debug(f"Response text: {response.text}")
+            # Log response details for debugging; skip building the dumps unless DEBUG is on
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Response status code: %s", response.status_code)
+                self.logger.debug("Response headers: %s", response.headers)
+                self.logger.debug("Response text: %s", response.text)
             
             # Handle different response status codes
-            if response.status_code == 401:
-                self.refresh_token()
-                return self.get_contact_by_odoo_id(odoo_id)
-            elif response.status_code == 204:  # No content
+            if response.status_code == 204:  # No content
                 return None
             elif response.status_code != 200:
                 self.logger.error(f"Error response from Zoho: Status {response.status_code}")
@@ -290,7 +489,7 @@ class ZohoClient:
             # Only try to parse JSON if we have content
             if response.text.strip():
                 try:
-                    data = response.json()
+                    data = _parse_json(response)
                     if data.get('data'):
                         return data['data']
                 except ValueError as e:
@@ -310,20 +509,16 @@ class ZohoClient:
                 raise Exception("No valid Zoho domain found")
                 
             url = f"{self.current_domain['base_url']}/{module}/{record_id}"
-            headers = {
-                'Authorization': f'Zoho-oauthtoken {self.access_token}',
-                'Content-Type': 'application/json'
-            }
             
             payload = {'data': [data]}
-            response = requests.put(url, headers=headers, json=payload)
-            
-            if response.status_code == 401:
-                self.refresh_token()
-                return self.update_record(module, record_id, data)
+            response = self._send('PUT', url, json=payload)
                 
-            return response.json()
+            return _parse_json(response)
             
         except Exception as e:
             self.logger.error(f"Error updating record: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+
+    def close(self):
+        """Close the pooled HTTP connections"""
+        self.session.close()
\ No newline at end of file
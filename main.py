@@ -1,29 +1,48 @@
 # main.py
 
 import logging
-import multiprocessing
+import os
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Event
-from typing import List, Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import chain, islice
+from threading import Event, Lock
+from typing import Iterable, Iterator, List, Dict, Any, Optional
 import requests
 from tqdm import tqdm
 import csv
+import gzip
 from datetime import datetime
 
-from config.settings import ODOO_CONFIG, ZOHO_CONFIG, BATCH_SIZE, RATE_LIMIT_DELAY
+from config.settings import (ODOO_CONFIG, ZOHO_CONFIG, BATCH_SIZE, MAX_WORKERS,
+                             ZOHO_REQUESTS_PER_SECOND, EXPORT_GZIP)
 from core.odoo_client import OdooClient
 from core.zoho_client import ZohoClient
 from core.data_mapper import ContactMapper, LeadMapper, PropertyMapper , UnitMapper
+from utils.concurrency import iter_completed
 from utils.logger import setup_logger
+from utils.validators import DataValidator
+
+# Odoo res.partner address field -> Zoho contact mailing field
+_OWNER_ADDRESS_FIELDS = (
+    ('street', 'Mailing_Street'),
+    ('city', 'Mailing_City'),
+    ('state_id', 'Mailing_State'),
+    ('country_id', 'Mailing_Country'),
+)
 
 class MigrationManager:
-    def __init__(self, max_workers: int = 7):
+    def __init__(self, max_workers: int = MAX_WORKERS):
         self.logger = setup_logger(__name__)
         self.odoo_client = OdooClient(ODOO_CONFIG)
         
         try:
-            self.zoho_client = ZohoClient(ZOHO_CONFIG)
+            # The rate is a fixed ceiling shared by all workers, independent of how many there are
+            self.zoho_client = ZohoClient(
+                ZOHO_CONFIG,
+                pool_maxsize=max_workers,
+                requests_per_second=ZOHO_REQUESTS_PER_SECOND
+            )
         except Exception as e:
             self.logger.error(f"Failed to initialize Zoho client: {str(e)}")
             raise
@@ -35,7 +54,12 @@ class MigrationManager:
         self.max_workers = max_workers
         self.stop_event = Event()
 
-        # Statistics
+        # Statistics; worker threads update them through record_stats
+        self._stats_lock = Lock()
+
+        # Future of the Zoho contact id per Odoo owner resolved outside the bulk lookup, shared by unit batches
+        self._owner_contact_ids: Dict[int, Future] = {}
+        self._owner_lock = Lock()
         self.processed_count = 0
         self.success_count = 0
         self.error_count = 0
@@ -45,22 +69,38 @@ class MigrationManager:
 
     def log_progress(self, record_type: str):
         """Log current progress statistics"""
-        if not self.start_time:
+        if not self.start_time or not self.logger.isEnabledFor(logging.INFO):
             return
             
+        processed, success, errors, skipped = self.get_stats()
         elapsed_time = time.time() - self.start_time
-        rate = self.success_count / elapsed_time if elapsed_time > 0 else 0
+        rate = success / elapsed_time if elapsed_time > 0 else 0
         
         self.logger.info(
-            f"\nProgress Report ({record_type}):\n"
-            f"Processed: {self.processed_count}/{self.total_records} "
-            f"({(self.processed_count/self.total_records*100):.2f}%)\n"
-            f"Successful: {self.success_count}\n"
-            f"Errors: {self.error_count}\n"
-            f"Skipped: {self.skipped_count}\n"
-            f"Rate: {rate:.2f} records/second"
+            "\nProgress Report (%s):\n"
+            "Processed: %d/%d (%.2f%%)\n"
+            "Successful: %d\n"
+            "Errors: %d\n"
+            "Skipped: %d\n"
+            "Rate: %.2f records/second",
+            record_type, processed, self.total_records,
+            processed / self.total_records * 100 if self.total_records else 0.0,
+            success, errors, skipped, rate
         )
 
+    def record_stats(self, success: int = 0, error: int = 0, skipped: int = 0, processed: int = 0):
+        """Add to the migration statistics; safe to call from worker threads"""
+        with self._stats_lock:
+            self.success_count += success
+            self.error_count += error
+            self.skipped_count += skipped
+            self.processed_count += processed
+
+    def get_stats(self) -> tuple:
+        """Consistent (processed, success, error, skipped) snapshot of the statistics"""
+        with self._stats_lock:
+            return self.processed_count, self.success_count, self.error_count, self.skipped_count
+
     def reset_statistics(self):
         """Reset migration statistics"""
         self.processed_count = 0
@@ -72,74 +112,129 @@ class MigrationManager:
 
     def find_contact_id(self, lead: Dict[str, Any], contact_map: Dict[str, str]) -> Optional[str]:
         """Find corresponding Zoho contact ID for a lead"""
-        if lead.get('mobile') and lead['mobile'] in contact_map:
-            return contact_map[lead['mobile']]
-        if lead.get('email_from') and lead['email_from'] in contact_map:
-            return contact_map[lead['email_from']]
-        return None
-
-    def process_lead_batch(self, batch: List[Dict[str, Any]], contact_map: Dict[str, str]) -> List[Dict[str, Any]]:
-        results = []
+        return (contact_map.get(DataValidator.normalize_phone(lead.get('mobile')))
+                or contact_map.get(DataValidator.normalize_email(lead.get('email_from'))))
+
+    def process_lead_batch(self, batch: List[Dict[str, Any]], contact_map: Dict[str, str]) -> Dict[str, int]:
+        """Migrate one batch of leads and return its counts; failures are logged per lead"""
+        # Counted locally; migrate_leads adds them to the shared totals from the main thread
+        counts = {'success': 0, 'error': 0, 'skipped': 0, 'processed': 0}
+        mapped_leads = []
         for lead in batch:
             if self.stop_event.is_set():
                 break
                 
+            name = lead.get('name')
             try:
                 contact_id = self.find_contact_id(lead, contact_map)
                 zoho_lead = self.lead_mapper.map_lead(lead, contact_id)
                 
                 if not zoho_lead:
-                    self.logger.debug(f"Lead mapping failed, skipping lead: {lead.get('name')}")
-                    self.skipped_count += 1
+                    self.logger.debug("Lead mapping failed, skipping lead: %s", name)
+                    counts['skipped'] += 1
                     continue
                 
-                result = self.zoho_client.create_record('Leads', zoho_lead)
-                
-                if result and result.get('data', [{}])[0].get('status') == 'success':
-                    self.success_count += 1
-                    self.logger.info(f"Successfully migrated lead: {lead.get('name')}")
-                else:
-                    self.error_count += 1
-                    self.logger.error(f"Failed to migrate lead {lead.get('name')}: {result}")
-                    results.append({'success': False, 'name': lead.get('name'), 'error': result})
-                
-                self.processed_count += 1
-                time.sleep(RATE_LIMIT_DELAY)
+                mapped_leads.append((name, zoho_lead))
                 
             except Exception as e:
-                self.error_count += 1
-                self.logger.error(f"Error processing lead {lead.get('name')}: {str(e)}")
-                results.append({'success': False, 'name': lead.get('name'), 'error': str(e)})
-                self.processed_count += 1
-        
-        return results
+                counts['error'] += 1
+                self.logger.error("Error processing lead %s: %s", name, e,
+                                  extra={'lead_name': name, 'error': str(e)})
+                counts['processed'] += 1
 
-    def export_properties_to_csv(self, properties: List[Dict[str, Any]]) -> str:
-        """Export mapped properties to CSV file"""
-        if not properties:
-            self.logger.warning("No properties to export")
-            return ""
+        if not mapped_leads:
+            return counts
 
+        # Insert the whole batch in as few requests as Zoho allows
         try:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f'property_export_{timestamp}.csv'
+            created = self.zoho_client.create_records('Leads', [zoho_lead for _, zoho_lead in mapped_leads])
+        except Exception as e:
+            created = [{'status': 'error', 'message': str(e)}] * len(mapped_leads)
+
+        for (name, _), result in zip(mapped_leads, created):
+            if result.get('status') == 'success':
+                counts['success'] += 1
+                self.logger.info("Successfully migrated lead: %s", name)
+            else:
+                counts['error'] += 1
+                self.logger.error("Failed to migrate lead %s: %s", name, result,
+                                  extra={'lead_name': name, 'error': result})
             
-            fieldnames = list(properties[0].keys())
+            counts['processed'] += 1
+
+        return counts
+
+    def export_properties_to_csv(self, properties: Iterable[Dict[str, Any]]) -> str:
+        """Stream mapped properties to a CSV file, writing each row as it arrives"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f'property_export_{timestamp}.csv'
+        if EXPORT_GZIP:
+            filename += '.gz'
+
+        try:
+            # A fixed schema means the header can be written before the first row exists
+            fieldnames = PropertyMapper.CSV_FIELDS
+            row_count = 0
             
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
+            if EXPORT_GZIP:
+                # Level 1 compresses repetitive CSV well at a fraction of the default level's CPU cost
+                csvfile = gzip.open(filename, 'wt', compresslevel=1, newline='', encoding='utf-8')
+            else:
+                # Large buffer so rows reach the disk in big writes rather than one syscall per row
+                csvfile = open(filename, 'w', newline='', encoding='utf-8', buffering=8 << 20)
+            with csvfile:
+                # Plain csv.writer with rows built in header order; DictWriter re-checks every key per row
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
                 
-                for prop in tqdm(properties, desc="Writing to CSV"):
-                    writer.writerow(prop)
+                for prop in properties:
+                    writer.writerow([prop.get(field, '') for field in fieldnames])
+                    row_count += 1
+            
+            if not row_count:
+                os.remove(filename)
+                self.logger.warning("No properties to export")
+                return ""
                     
-            self.logger.info(f"Successfully exported {len(properties)} properties to {filename}")
+            self.logger.info(f"Successfully exported {row_count} properties to {filename}")
             return filename
             
         except Exception as e:
             self.logger.error(f"Error exporting to CSV: {str(e)}")
+            # Keep the rows written so far for inspection, but not under the name of a complete export
+            if os.path.exists(filename):
+                os.replace(filename, filename + '.partial')
+                self.logger.error(f"Incomplete export left at {filename}.partial")
             raise
 
+    def _map_properties(self, batches: Iterable[List[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+        """Yield each mapped property as soon as it is ready so it can be written straight out"""
+        # Mapped in this process: a property takes a few microseconds, less than pickling it to a worker
+        map_property = PropertyMapper.map_property
+        # Progress is reported once per Odoo batch rather than per record
+        with tqdm(total=self.total_records, desc="Mapping properties", mininterval=0.5) as pbar:
+            for batch in batches:
+                for prop in batch:
+                    if self.stop_event.is_set():
+                        return
+
+                    self.processed_count += 1
+                    try:
+                        mapped_property = map_property(prop)
+                    except Exception as e:
+                        self.error_count += 1
+                        self.logger.error(f"Error mapping property {prop.get('name')}: {str(e)}")
+                        continue
+
+                    if mapped_property:
+                        self.success_count += 1
+                        yield mapped_property
+                    else:
+                        self.skipped_count += 1
+
+                pbar.update(len(batch))
+                self.log_progress("Properties")
+
     def migrate_properties(self):
         """Property migration process"""
         self.logger.info("Starting property migration")
@@ -161,48 +256,21 @@ class MigrationManager:
             # Add ownership_type to domain to filter only freehold/leashold properties
             domain = [('ownership_type', 'in', ['freehold', 'leashold'])]
             
-            properties = self.odoo_client.fetch_records(
+            self.total_records = self.odoo_client.count_records('property.master', domain)
+            self.logger.info(f"Found {self.total_records} freehold/leasehold properties to process")
+            
+            # Odoo batches are mapped and written as they arrive instead of being loaded up front
+            properties = self.odoo_client.iter_records(
                 'property.master',  # Updated model name
                 fields=property_fields,
                 domain=domain,
                 batch_size=BATCH_SIZE
-                
             )
             
-            self.total_records = len(properties)
-            self.logger.info(f"Found {self.total_records} freehold/leasehold properties to process")
-            
-            mapped_properties = []
-            with tqdm(total=self.total_records, desc="Mapping properties") as pbar:
-                for prop in properties:
-                    if self.stop_event.is_set():
-                        break
-                    
-                    print('prop:      ', prop)
-                    print('------------------------------------')
-                    try:
-                        mapped_property = self.property_mapper.map_property(prop)
-                        if mapped_property:
-                            mapped_properties.append(mapped_property)
-                            self.success_count += 1
-                        else:
-                            self.skipped_count += 1
-                            
-                        self.processed_count += 1
-                        
-                        if self.processed_count % 100 == 0:
-                            self.log_progress("Properties")
-                            
-                    except Exception as e:
-                        self.error_count += 1
-                        self.logger.error(f"Error mapping property {prop.get('name')}: {str(e)}")
-                        
-                    pbar.update(1)
-            
-            if mapped_properties:
-                filename = self.export_properties_to_csv(mapped_properties)
+            filename = self.export_properties_to_csv(self._map_properties(properties))
+            if filename:
                 self.logger.info(f"Property migration completed. CSV file created: {filename}")
-                self.logger.info(f"Total freehold/leasehold properties exported: {len(mapped_properties)}")
+                self.logger.info(f"Total freehold/leasehold properties exported: {self.success_count}")
             else:
                 self.logger.warning("No properties were successfully mapped")
                 
@@ -222,44 +290,41 @@ class MigrationManager:
             lead_fields = [
                 'name', 'partner_name', 'contact_name', 'email_from',
                 'phone', 'mobile', 'description', 'stage_id', 'source_id',
-                'expected_revenue', 'probability', 'partner_id'
+                'expected_revenue', 'probability'
             ]
             
-            leads = self.odoo_client.fetch_records(
-                'crm.lead', 
-                fields=lead_fields, 
-                batch_size=BATCH_SIZE
-            )
-            
-            self.total_records = len(leads)
+            self.total_records = self.odoo_client.count_records('crm.lead')
             self.logger.info(f"Found {self.total_records} leads to process")
             
-            batches = [leads[i:i + BATCH_SIZE] 
-                      for i in range(0, len(leads), BATCH_SIZE)]
+            # Leads are pulled from Odoo batch by batch while earlier ones are already uploading;
+            # re-chunk the record stream so every upload batch holds exactly BATCH_SIZE leads
+            leads = chain.from_iterable(
+                self.odoo_client.iter_records('crm.lead', fields=lead_fields, batch_size=BATCH_SIZE)
+            )
+            batches = iter(lambda: list(islice(leads, BATCH_SIZE)), [])
 
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 self.logger.info(f"Starting migration with {self.max_workers} workers")
-                futures = []
 
-                for batch in batches:
-                    future = executor.submit(
-                        self.process_lead_batch, 
-                        batch,
-                        contact_map
-                    )
-                    futures.append(future)
-                
-                with tqdm(total=len(futures), desc="Processing lead batches") as pbar:
-                    for future in as_completed(futures):
-                        if self.stop_event.is_set():
-                            break
+                # Sliding window: keep 2 * max_workers batches queued and submit the next
+                # one as each completes, so the first requests start right away
+                completed = iter_completed(
+                    executor, partial(self.process_lead_batch, contact_map=contact_map),
+                    batches, 2 * self.max_workers, self.stop_event
+                )
+
+                completed_batches = 0
+                with tqdm(total=self.total_records, desc="Processing leads", unit="leads") as pbar:
+                    for _, future in completed:
                         try:
-                            future.result()
-                            pbar.update(1)
-                            
-                            if pbar.n % 10 == 0:
+                            batch_counts = future.result()
+                            self.record_stats(**batch_counts)
+                            pbar.update(batch_counts['processed'] + batch_counts['skipped'])
+
+                            completed_batches += 1
+                            if completed_batches % 10 == 0:
                                 self.log_progress("Leads")
-                                
+
                         except Exception as e:
                             self.logger.error(f"Batch processing failed: {str(e)}")
 
@@ -281,8 +346,7 @@ class MigrationManager:
     def create_owner_contact(self, owner_data: Dict[str, Any]) -> Optional[str]:
         """Create a new contact in Zoho for the property owner"""
 
-        print('owner_data:       ', owner_data)
-        print('------------------------------------')
+        self.logger.debug("owner_data: %s", owner_data)
 
         # try:
         # Extract owner name
@@ -296,39 +360,35 @@ class MigrationManager:
         # first_name = name_parts[0]
         # last_name = name_parts[1] if len(name_parts) > 1 else 'Unknown'
 
-        # Prepare contact data
+        # Owners without a mobile number are not created; check before building the payload
+        mobile = owner_data.get('mobile', '')
+        if mobile is False:
+            return None
+
+        # Prepare contact data; Odoo sends False for empty fields
         contact_data = {
-            'First_Name': owner_data.get('name', '').strip(),
-            'Last_Name': owner_data.get('name', '').strip(),
-            'Email': owner_data.get('email', ''),
-            'Phone': owner_data.get('phone', ''),
-            'Mobile': owner_data.get('mobile', ''),
+            'First_Name': full_name,
+            'Last_Name': full_name,
+            'Email': owner_data.get('email') or '',
+            'Phone': owner_data.get('phone') or '',
+            'Mobile': mobile,
             'Contact_Type': 'Property Owner',
             'Description': 'Automatically created during property migration',
             'Source': 'Odoo Migration'
         }
-        if contact_data['Email'] == False:
-            contact_data['Email'] = ''
-        
-        if contact_data['Phone'] == False:
-            contact_data['Phone'] = ''
-        
-        if contact_data['Mobile'] == False:
-            return None
         
-        # Add address if available
-        if owner_data.get('address'):
-            contact_data.update({
-                'Mailing_Street': owner_data.get('address', ''),
-                'Mailing_City': owner_data.get('city', ''),
-                'Mailing_State': owner_data.get('state', ''),
-                'Mailing_Country': owner_data.get('country', '')
-            })
+        # Add address fields that are set; state and country are many2one (id, name) pairs
+        for odoo_field, zoho_field in _OWNER_ADDRESS_FIELDS:
+            value = owner_data.get(odoo_field)
+            if isinstance(value, (list, tuple)):
+                value = value[1] if len(value) > 1 else None
+            if value:
+                contact_data[zoho_field] = value
         
-        print(contact_data)
+        self.logger.debug("contact_data: %s", contact_data)
         # Create contact in Zoho
         result = self.zoho_client.create_record('Contacts', contact_data)
-        print("result:      ", result)
+        self.logger.debug("create_record response: %s", result)
         
         if result and result.get('data', [{}])[0].get('status') == 'success':
             contact_id = result['data'][0]['details']['id']
@@ -364,10 +424,45 @@ class MigrationManager:
             self.logger.error(f"Error getting/creating owner contact: {str(e)}")
             return None
 
-    def process_unit_batch(self, batch: List[Dict[str, Any]], contact_map: Dict[str, str]) -> List[Dict[str, Any]]:
-        """Process a batch of units for migration"""
-        results = []
+    def resolve_owner_contact(self, owner_id: int, contact_map: Dict[str, str],
+                              owner_records: Dict[int, Dict[str, Any]]) -> Optional[str]:
+        """Find or create the Zoho contact for an Odoo owner, once per owner that succeeds"""
+        # The global lock only claims the owner; the Zoho calls run outside it so different owners
+        # resolve in parallel, while a second batch with the same owner waits on the first one's future
+        with self._owner_lock:
+            future = self._owner_contact_ids.get(owner_id)
+            resolving = future is None
+            if resolving:
+                future = self._owner_contact_ids[owner_id] = Future()
+
+        if not resolving:
+            return future.result()
+
+        # Create owner if not exists, from the partners prefetched in migrate_units
+        owner_contact_id = None
+        try:
+            owner_data = owner_records.get(owner_id)
+            if owner_data:
+                owner_contact_id = self.get_or_create_owner_contact(owner_data, contact_map)
+        finally:
+            if owner_contact_id is None:
+                # Failures may be transient; forget them so the owner's next unit tries again
+                with self._owner_lock:
+                    self._owner_contact_ids.pop(owner_id, None)
+            future.set_result(owner_contact_id)
+        return owner_contact_id
+
+    def process_unit_batch(self, batch: List[Dict[str, Any]], contact_map: Dict[str, str],
+                           owner_contacts: Dict[str, Dict[str, Any]],
+                           existing_units: Dict[str, Dict[str, Any]],
+                           owner_records: Dict[int, Dict[str, Any]]) -> Dict[str, int]:
+        """Process a batch of units for migration and return its counts; failures are logged per unit"""
+        # Counted locally; migrate_units adds them to the shared totals from the main thread
+        counts = {'success': 0, 'error': 0, 'skipped': 0, 'processed': 0}
         MODULE_NAME = "Properties_Units"  # Confirmed module name
+        # Mapped units are collected and sent in bulk: one create and one update call per batch
+        new_units = []
+        updated_units = []
         
         for unit in batch:
             if self.stop_event.is_set():
@@ -375,39 +470,27 @@ class MigrationManager:
                 
             # try:
             # Check if unit already exists
-            existing_unit = self.zoho_client.get_existing_unit(unit.get('property_code'))
+            existing_unit = existing_units.get(str(unit.get('property_code')))
             is_update = existing_unit is not None
             
             # Extract owner information
             owner_id = unit.get('owner_id', [False, False])
-            owner_data = {}
             owner_contact_id = None
             
             if isinstance(owner_id, (list, tuple)) and len(owner_id) > 1:
                 # First check if owner exists in Zoho by Odoo_ID
-                print('owner_id:    ',  owner_id)
-                owner_contact = self.zoho_client.get_contact_by_odoo_id(str(owner_id[0]))
+                self.logger.debug("owner_id: %s", owner_id)
+                owner_contact = owner_contacts.get(str(owner_id[0]))
                 if owner_contact:
-                    owner_contact_id = owner_contact[0]['Owner']['id']
+                    owner_contact_id = owner_contact['Owner']['id']
                 else:
-                    # Fetch and create owner if not exists
-                    owner_data = self.odoo_client.fetch_records(
-                        'res.partner',
-                        fields=[
-                            'name', 'email', 'phone', 'mobile',
-                            'street', 'city', 'state_id', 'country_id'
-                        ],
-                        domain=[('id', '=', owner_id[0])],
-                        batch_size=1
-                    )
-                    if owner_data:
-                        owner_contact_id = self.get_or_create_owner_contact(owner_data[0], contact_map)
-            self.logger.debug(f"unit: {unit}")
+                    owner_contact_id = self.resolve_owner_contact(owner_id[0], contact_map, owner_records)
+            self.logger.debug("unit: %s", unit)
             # Map unit data based on whether it's an update or new record
             zoho_unit = self.unit_mapper.map_unit(unit, is_update)
             if not zoho_unit:
-                self.logger.debug(f"Unit mapping failed, skipping unit: {unit.get('name')}")
-                self.skipped_count += 1
+                self.logger.debug("Unit mapping failed, skipping unit: %s", unit.get('name'))
+                counts['skipped'] += 1
                 continue
             
             # Add owner reference if available
@@ -419,49 +502,74 @@ class MigrationManager:
             if amenities:
                 zoho_unit['Private_Amenities'] = amenities
             
-            self.logger.debug(f"Payload for {'update' if is_update else 'create'}: {zoho_unit}")
+            self.logger.debug("Payload for %s: %s", 'update' if is_update else 'create', zoho_unit)
             
             if is_update:
-                # Update existing record
-                result = self.zoho_client.update_record(
-                    MODULE_NAME, 
-                    existing_unit['id'], 
-                    zoho_unit
-                )
-                operation = "updated"
-            else:
-                # Create new record
-                result = self.zoho_client.create_record(MODULE_NAME, zoho_unit)
-                operation = "created"
-            
-            if result and result.get('data', [{}])[0].get('status') == 'success':
-                self.success_count += 1
-                self.logger.info(f"Successfully {operation} unit: {unit.get('name')}")
+                # Existing record, identified by its Zoho id in the bulk update
+                zoho_unit['id'] = existing_unit['id']
+                updated_units.append((unit.get('name'), zoho_unit))
             else:
-                self.error_count += 1
-                self.logger.error(f"Failed to {operation} unit {unit.get('name')}: {result}")
-                results.append({
-                    'success': False,
-                    'name': unit.get('name'),
-                    'error': result,
-                    'operation': operation
-                })
+                new_units.append((unit.get('name'), zoho_unit))
+        
+        for operation, write_records, pending in (
+            ("created", self.zoho_client.create_records, new_units),
+            ("updated", self.zoho_client.update_records, updated_units),
+        ):
+            if not pending:
+                continue
+            try:
+                written = write_records(MODULE_NAME, [zoho_unit for _, zoho_unit in pending])
+            except Exception as e:
+                written = [{'status': 'error', 'message': str(e)}] * len(pending)
             
-            self.processed_count += 1
-            time.sleep(RATE_LIMIT_DELAY)
-                
-            # except Exception as e:
-            #     self.error_count += 1
-            #     self.logger.error(f"Error processing unit {unit.get('name')}: {str(e)}")
-            #     results.append({
-            #         'success': False,
-            #         'name': unit.get('name'),
-            #         'error': str(e),
-            #         'operation': 'processing'
-            #     })
-            #     self.processed_count += 1
+            for (name, _), result in zip(pending, written):
+                if result.get('status') == 'success':
+                    counts['success'] += 1
+                    self.logger.info("Successfully %s unit: %s", operation, name)
+                else:
+                    counts['error'] += 1
+                    self.logger.error("Failed to %s unit %s: %s", operation, name, result,
+                                      extra={'unit_name': name, 'error': result, 'operation': operation})
+                counts['processed'] += 1
         
-        return results
+        return counts
+
+    def _prepare_unit_batches(self, pages: Iterable[List[Dict[str, Any]]]) -> Iterator[tuple]:
+        """Yield (batch, lookups) for each unit batch, running the bulk lookups once per Odoo page"""
+        for units in pages:
+            # Look up existing units and owner contacts in bulk rather than one search per unit
+            existing_units = self.zoho_client.get_existing_units(
+                unit['property_code'] for unit in units if unit.get('property_code')
+            )
+            owner_ids = {
+                unit['owner_id'][0] for unit in units
+                if isinstance(unit.get('owner_id'), (list, tuple)) and len(unit['owner_id']) > 1
+            }
+            owner_contacts = self.zoho_client.get_contacts_by_odoo_ids(owner_ids)
+
+            # Owners not yet in Zoho are read from Odoo in one query instead of one per unit
+            missing_owner_ids = sorted(
+                owner_id for owner_id in owner_ids
+                if str(owner_id) not in owner_contacts and owner_id not in self._owner_contact_ids
+            )
+            owner_records = {}
+            if missing_owner_ids:
+                owner_records = {
+                    partner['id']: partner
+                    for partner in self.odoo_client.fetch_records(
+                        'res.partner',
+                        fields=[
+                            'name', 'email', 'phone', 'mobile',
+                            'street', 'city', 'state_id', 'country_id'
+                        ],
+                        domain=[('id', 'in', missing_owner_ids)],
+                        batch_size=BATCH_SIZE
+                    )
+                }
+
+            lookups = (owner_contacts, existing_units, owner_records)
+            for i in range(0, len(units), BATCH_SIZE):
+                yield units[i:i + BATCH_SIZE], lookups
 
     def migrate_units(self):
         """Unit migration process with automatic contact creation"""
@@ -514,47 +622,45 @@ class MigrationManager:
                 'web_portal_ids', 'view360_url', 'floor_plan_url'
             ]
             
-            # Fetch units from Odoo
-            units = self.odoo_client.fetch_records(
+            self.total_records = self.odoo_client.count_records('account.asset.asset')
+            self.logger.info(f"Found {self.total_records} units to process")
+
+            # Units are fetched from Odoo page by page; each page's Zoho lookups run just before its
+            # batches are submitted, so uploads of earlier pages overlap with fetching later ones
+            pages = self.odoo_client.iter_records(
                 'account.asset.asset',  # The model name for units
                 fields=unit_fields,
                 batch_size=BATCH_SIZE
             )
-            
-            self.total_records = len(units)
-            self.logger.info(f"Found {self.total_records} units to process")
-            
-            # Create batches
-            batches = [units[i:i + BATCH_SIZE] 
-                    for i in range(0, len(units), BATCH_SIZE)]
+            batches = self._prepare_unit_batches(pages)
             
             # Process batches with thread pool
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 self.logger.info(f"Starting migration with {self.max_workers} workers")
-                futures = []
-                
-                for batch in batches:
-                    future = executor.submit(
-                        self.process_unit_batch, 
-                        batch,
-                        contact_map
-                    )
-                    futures.append(future)
+
+                def process_batch(prepared):
+                    batch, lookups = prepared
+                    return self.process_unit_batch(batch, contact_map, *lookups)
+
+                # Sliding window, as in migrate_leads: at most 2 * max_workers batches queued
+                completed = iter_completed(executor, process_batch, batches, 2 * self.max_workers, self.stop_event)
                 
                 # Monitor progress
-                with tqdm(total=len(futures), desc="Processing unit batches") as pbar:
-                    for future in as_completed(futures):
-                        if self.stop_event.is_set():
-                            break
-                        # try:
-                        future.result()
-                        pbar.update(1)
-                        
-                        if pbar.n % 10 == 0:
+                completed_batches = 0
+                with tqdm(total=self.total_records, desc="Processing units", unit="units") as pbar:
+                    for (batch, _), future in completed:
+                        try:
+                            batch_counts = future.result()
+                        except Exception as e:
+                            # One failed batch is counted as errors rather than ending the whole migration
+                            self.logger.error(f"Unit batch processing failed: {str(e)}")
+                            batch_counts = {'error': len(batch), 'processed': len(batch), 'skipped': 0}
+                        self.record_stats(**batch_counts)
+                        pbar.update(batch_counts['processed'] + batch_counts['skipped'])
+
+                        completed_batches += 1
+                        if completed_batches % 10 == 0:
                             self.log_progress("Units")
-                                
-                        # except Exception as e:
-                        #     self.logger.error(f"Batch processing failed: {str(e)}")
 
             # Final summary
             end_time = time.time()
@@ -576,7 +682,9 @@ def main():
     logger = setup_logger(__name__)
     
     try:
-        max_workers = max(1, multiprocessing.cpu_count() // 2)
+        # Threads mostly wait on HTTP round trips, so size them for concurrency rather than CPUs;
+        # property mapping still uses one process per CPU
+        max_workers = MAX_WORKERS
         logger.info(f"Starting migration with {max_workers} workers")
         
         migration_manager = MigrationManager(max_workers=max_workers)
@@ -598,6 +706,8 @@ def main():
         logger.error(f"Fatal error: {str(e)}")
         raise
     finally:
+        if 'migration_manager' in locals():
+            migration_manager.zoho_client.close()
         logger.info("Migration process completed")
 
 if __name__ == "__main__":
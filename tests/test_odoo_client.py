@@ -0,0 +1,115 @@
+# tests/test_odoo_client.py
+
+import threading
+import unittest
+from unittest import mock
+
+from core import odoo_client
+from core.odoo_client import OdooClient
+
+# Sparse ids, as in a real table after deletions
+RECORDS = [
+    {
+        'id': record_id,
+        'name': f'Lead {record_id}',
+        'state': 'won' if record_id % 3 else 'lost',
+        'partner_id': [record_id % 4 + 1, f'Partner {record_id % 4}'] if record_id % 5 else False,
+    }
+    for record_id in range(1, 700, 7)
+]
+
+def _matches(record, domain):
+    for field, operator, value in domain:
+        if operator == '=' and not record[field] == value:
+            return False
+        if operator == '>' and not record[field] > value:
+            return False
+        if operator == '<=' and not record[field] <= value:
+            return False
+    return True
+
+class FakeConnection:
+    """In-memory stand-in for one Odoo JSON-RPC service connection"""
+    records = RECORDS
+    calls = []
+    lock = threading.Lock()
+
+    def __init__(self, url, service, timeout=None):
+        self.service = service
+
+    def authenticate(self, db, username, password, context):
+        return 2
+
+    def close(self):
+        pass
+
+    def execute_kw(self, db, uid, password, model, method, args, kwargs=None):
+        kwargs = kwargs or {}
+        with self.lock:
+            self.calls.append((method, args, kwargs))
+        if method == 'fields_get':
+            return {'name': {'type': 'char'}, 'state': {'type': 'selection'}, 'partner_id': {'type': 'many2one'}}
+
+        rows = [record for record in self.records if _matches(record, args[0])]
+        if method == 'search_count':
+            return len(rows)
+        if method == 'search':
+            return [record['id'] for record in rows]
+        if method == 'search_read':
+            rows = rows[:kwargs['limit']]
+            return [{field: record[field] for field in kwargs['fields'] + ['id']} for record in rows]
+        raise AssertionError(f'unexpected method {method}')
+
+class IterRecordsTest(unittest.TestCase):
+    def setUp(self):
+        FakeConnection.records = RECORDS
+        FakeConnection.calls = []
+        patcher = mock.patch.object(odoo_client, '_JsonRpcConnection', FakeConnection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = OdooClient({'url': 'http://odoo', 'db': 'db', 'username': 'u', 'password': 'p'}, max_workers=3)
+
+    def fetch(self, **kwargs):
+        return [record for batch in self.client.iter_records('crm.lead', **kwargs) for record in batch]
+
+    def test_every_record_is_returned_once_for_any_batch_size(self):
+        for batch_size in (1, 7, 30, 1000):
+            with self.subTest(batch_size=batch_size):
+                records = self.fetch(fields=['name'], batch_size=batch_size)
+                self.assertEqual(sorted(record['id'] for record in records), [record['id'] for record in RECORDS])
+
+    def test_pages_are_id_ranges_not_offsets(self):
+        self.fetch(fields=['name'], domain=[('state', '=', 'won')], batch_size=10)
+        reads = [call for call in FakeConnection.calls if call[0] == 'search_read']
+        self.assertTrue(reads)
+        for _, args, kwargs in reads:
+            self.assertNotIn('offset', kwargs)
+            self.assertEqual(args[0][0], ('state', '=', 'won'))
+            (_, after_op, after), (_, upto_op, upto) = args[0][1:]
+            self.assertEqual((after_op, upto_op), ('>', '<='))
+            self.assertLess(after, upto)
+
+    def test_domain_is_applied_to_every_page(self):
+        records = self.fetch(fields=['state'], domain=[('state', '=', 'won')], batch_size=10)
+        expected = [record['id'] for record in RECORDS if record['state'] == 'won']
+        self.assertEqual(sorted(record['id'] for record in records), expected)
+
+    def test_ids_only_needs_no_read(self):
+        records = self.fetch(fields=['id'], batch_size=10)
+        self.assertEqual([record['id'] for record in records], [record['id'] for record in RECORDS])
+        self.assertEqual([call[0] for call in FakeConnection.calls], ['search'])
+
+    def test_empty_result_yields_nothing(self):
+        self.assertEqual(self.fetch(fields=['name'], domain=[('state', '=', 'missing')]), [])
+
+    def test_many2one_pairs_are_shared_and_nameless_ones_kept(self):
+        FakeConnection.records = RECORDS + [{'id': 9999, 'name': 'Orphan', 'state': 'won', 'partner_id': [77, False]}]
+        records = self.fetch(fields=['name', 'partner_id'], batch_size=10)
+        partners = [record['partner_id'] for record in records if record['partner_id']]
+        by_id = {}
+        for partner in partners:
+            self.assertIs(by_id.setdefault(partner[0], partner), partner)
+        self.assertEqual(by_id[77], (77, False))
+
+if __name__ == '__main__':
+    unittest.main()
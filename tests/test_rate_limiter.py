@@ -0,0 +1,98 @@
+# tests/test_rate_limiter.py
+
+import unittest
+from unittest import mock
+
+from utils import rate_limiter
+from utils.rate_limiter import TokenBucket
+
+class FakeClock:
+    """Stands in for the time module: sleep() advances the clock instead of blocking"""
+
+    def __init__(self, now: float = 1000.0, wall: float = 1_700_000_000.0):
+        self.now = now
+        self.wall = wall
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.wall + self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+class TokenBucketTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(rate_limiter, 'time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def elapsed(self, bucket: TokenBucket, calls: int) -> float:
+        start = self.clock.now
+        for _ in range(calls):
+            bucket.acquire()
+        return self.clock.now - start
+
+    def test_burst_is_immediate_then_paced_at_rate(self):
+        bucket = TokenBucket(2.0, burst=2)
+        self.assertEqual(self.elapsed(bucket, 2), 0)
+        self.assertAlmostEqual(self.elapsed(bucket, 3), 1.5)
+
+    def test_idle_time_refills_up_to_burst_only(self):
+        bucket = TokenBucket(2.0, burst=2)
+        self.elapsed(bucket, 2)
+        self.clock.now += 60
+        self.assertEqual(self.elapsed(bucket, 2), 0)
+        self.assertAlmostEqual(self.elapsed(bucket, 1), 0.5)
+
+    def test_headers_with_delay_reset_set_rate(self):
+        bucket = TokenBucket(10.0, burst=1)
+        bucket.update_from_headers({'X-RATELIMIT-REMAINING': '50', 'X-RATELIMIT-RESET': '20'})
+        self.assertAlmostEqual(bucket.rate, 2.5)
+
+    def test_headers_with_epoch_reset_in_seconds_and_milliseconds(self):
+        bucket = TokenBucket(10.0, burst=1)
+        reset = self.clock.time() + 25
+        bucket.update_from_headers({'X-RATELIMIT-REMAINING': '50', 'X-RATELIMIT-RESET': str(reset)})
+        self.assertAlmostEqual(bucket.rate, 2.0)
+        bucket.update_from_headers({'X-RATELIMIT-REMAINING': '50', 'X-RATELIMIT-RESET': str(reset * 1000)})
+        self.assertAlmostEqual(bucket.rate, 2.0)
+
+    def test_headers_never_raise_rate_above_configured_maximum(self):
+        bucket = TokenBucket(5.0, burst=1)
+        bucket.update_from_headers({'X-RATELIMIT-REMAINING': '1000', 'X-RATELIMIT-RESET': '1'})
+        self.assertEqual(bucket.rate, 5.0)
+
+    def test_exhausted_quota_blocks_the_next_acquire(self):
+        bucket = TokenBucket(10.0, burst=5)
+        bucket.update_from_headers({'X-RATELIMIT-REMAINING': '0', 'X-RATELIMIT-RESET': '10'})
+        # One request allowed per 10s window, and no token left in the bucket
+        self.assertAlmostEqual(bucket.rate, 0.1)
+        self.assertAlmostEqual(self.elapsed(bucket, 1), 10.0)
+
+    def test_missing_or_malformed_headers_are_ignored(self):
+        bucket = TokenBucket(4.0, burst=1)
+        bucket.update_from_headers({})
+        bucket.update_from_headers({'X-RATELIMIT-REMAINING': '10'})
+        bucket.update_from_headers({'X-RATELIMIT-REMAINING': 'many', 'X-RATELIMIT-RESET': '10'})
+        self.assertEqual(bucket.rate, 4.0)
+
+    def test_penalize_holds_back_every_caller(self):
+        bucket = TokenBucket(2.0, burst=4)
+        bucket.penalize(3.0)
+        # The 3s penalty plus the time to earn the first token back
+        self.assertAlmostEqual(self.elapsed(bucket, 1), 3.5)
+        self.assertAlmostEqual(self.elapsed(bucket, 1), 0.5)
+
+    def test_penalize_does_not_shorten_a_longer_wait(self):
+        bucket = TokenBucket(1.0, burst=1)
+        bucket.penalize(10.0)
+        bucket.penalize(2.0)
+        self.assertAlmostEqual(self.elapsed(bucket, 1), 11.0)
+
+if __name__ == '__main__':
+    unittest.main()
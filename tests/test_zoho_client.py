@@ -0,0 +1,112 @@
+# tests/test_zoho_client.py
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import requests
+
+from core import zoho_client
+from core.zoho_client import ZohoClient
+
+class FakeResponse:
+    def __init__(self, status_code, body=None, request_headers=None):
+        self.status_code = status_code
+        self.headers = {}
+        self.content = json.dumps(body).encode() if body is not None else b''
+        self.text = self.content.decode()
+        self.request = mock.Mock(headers=dict(request_headers or {}))
+
+    def json(self):
+        return json.loads(self.content)
+
+class FakeSession:
+    """Records every request and answers API calls through a handler(method, url, records)"""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.headers = {}
+        self.requests = []
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def post(self, url, **kwargs):
+        # Only the token exchange calls post() directly
+        return FakeResponse(200, {'access_token': 'token', 'expires_in': 3600})
+
+    def request(self, method, url, **kwargs):
+        # _send encodes bodies itself when orjson is installed
+        body = kwargs['json'] if 'json' in kwargs else json.loads(kwargs['data'])
+        self.requests.append((method, url, body['data']))
+        return self.handler(method, url, body['data'])
+
+def created(method, url, records):
+    return FakeResponse(201, {'data': [
+        {'status': 'success', 'details': {'id': f"z{record['Last_Name']}"}} for record in records
+    ]})
+
+class WriteRecordsTest(unittest.TestCase):
+    def make_client(self, handler):
+        session = FakeSession(handler)
+        cache = tempfile.NamedTemporaryFile(delete=False)
+        cache.close()
+        self.addCleanup(os.remove, cache.name)
+        with mock.patch.object(zoho_client.requests, 'Session', return_value=session), \
+                mock.patch.object(ZohoClient, 'DOMAIN_CACHE_PATH', cache.name):
+            client = ZohoClient({'refresh_token': 'r', 'client_id': 'c', 'client_secret': 's'},
+                                requests_per_second=1000)
+        return client, session
+
+    @staticmethod
+    def leads(count):
+        return [{'Last_Name': str(i)} for i in range(count)]
+
+    def test_records_are_sent_in_chunks_of_100_and_results_keep_order(self):
+        client, session = self.make_client(created)
+        results = client.create_records('Leads', self.leads(250))
+
+        self.assertEqual([len(records) for _, _, records in session.requests], [100, 100, 50])
+        self.assertTrue(all(method == 'POST' for method, _, _ in session.requests))
+        self.assertEqual([result['details']['id'] for result in results], [f'z{i}' for i in range(250)])
+
+    def test_a_failed_chunk_keeps_the_results_of_the_others(self):
+        def handler(method, url, records):
+            if records[0]['Last_Name'] == '100':
+                raise requests.ConnectionError('connection reset')
+            return created(method, url, records)
+
+        client, session = self.make_client(handler)
+        results = client.create_records('Leads', self.leads(250))
+
+        statuses = [result['status'] for result in results]
+        self.assertEqual(statuses, ['success'] * 100 + ['error'] * 100 + ['success'] * 50)
+        self.assertIn('connection reset', results[150]['message'])
+        # A create that may have reached Zoho is not sent again
+        self.assertEqual(len(session.requests), 3)
+
+    def test_a_rejected_chunk_reports_the_response_for_each_record(self):
+        rejection = {'code': 'INVALID_DATA', 'status': 'error', 'message': 'invalid data'}
+
+        def handler(method, url, records):
+            if records[0]['Last_Name'] == '0':
+                return FakeResponse(400, rejection)
+            return created(method, url, records)
+
+        client, _ = self.make_client(handler)
+        results = client.create_records('Leads', self.leads(150))
+
+        self.assertEqual(results[:100], [rejection] * 100)
+        self.assertTrue(all(result['status'] == 'success' for result in results[100:]))
+
+    def test_updates_are_sent_with_put(self):
+        client, session = self.make_client(created)
+        results = client.update_records('Leads', self.leads(3))
+
+        self.assertEqual([method for method, _, _ in session.requests], ['PUT'])
+        self.assertEqual(len(results), 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+# utils/concurrency.py
+
+from concurrent.futures import Executor, Future, FIRST_COMPLETED, wait
+from itertools import islice
+from threading import Event
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+def iter_completed(executor: Executor, fn: Callable[[Any], Any], items: Iterable[Any], window: int,
+                   stop_event: Optional[Event] = None) -> Iterator[Tuple[Any, Future]]:
+    """Run fn over items with at most window calls in flight, yielding (item, future) as each completes
+
+    Items are pulled lazily, one per finished call, so a streaming source is never read more
+    than window items ahead. Callers read future.result() themselves and decide what a failure means.
+    """
+    pending = iter(items)
+    in_flight = {executor.submit(fn, item): item for item in islice(pending, window)}
+
+    while in_flight and not (stop_event is not None and stop_event.is_set()):
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        completed = [(in_flight.pop(future), future) for future in done]
+
+        # Refill the window before handing results back so the workers stay busy meanwhile
+        for item in islice(pending, len(done)):
+            in_flight[executor.submit(fn, item)] = item
+
+        yield from completed
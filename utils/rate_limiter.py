@@ -0,0 +1,64 @@
+# utils/rate_limiter.py
+
+import time
+from threading import Lock
+from typing import Mapping
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every thread calling the same API"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.max_rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """Spread the remaining quota reported by the server over its reset window"""
+        remaining = headers.get('X-RATELIMIT-REMAINING')
+        reset = headers.get('X-RATELIMIT-RESET')
+        if remaining is None or reset is None:
+            return
+
+        try:
+            remaining = int(remaining)
+            reset = float(reset)
+        except ValueError:
+            return
+
+        # The reset header is either an epoch timestamp (seconds or milliseconds) or a delay
+        if reset > 1e12:
+            reset = reset / 1000 - time.time()
+        elif reset > 1e9:
+            reset -= time.time()
+        reset = max(reset, 1.0)
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, max(remaining, 1) / reset)
+            if remaining <= 0:
+                self._tokens = min(self._tokens, 0)
+
+    def penalize(self, seconds: float):
+        """Hold back every caller for the given time, e.g. after a 429"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, -seconds * self.rate)
@@ -1,10 +1,32 @@
 # utils/validators.py
 
 import re
+from functools import lru_cache
 from typing import Optional
 
+# Patterns are compiled once at import rather than looked up on every call
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_NON_DIGIT_RE = re.compile(r'\D')
+_NAME_STRIP_RE = re.compile(r'[^\w\s-]')
+
+# Deletes every ASCII non-digit; str.translate filters in C without the regex engine
+_NON_DIGIT_TABLE = str.maketrans('', '', ''.join(chr(i) for i in range(128) if not chr(i).isdigit()))
+
+def _digits(value: str) -> str:
+    """Strip everything but digits from value"""
+    digits = value.translate(_NON_DIGIT_TABLE)
+    # Non-ASCII characters survive the table; let the regex handle those rare values
+    if not digits.isdecimal():
+        digits = _NON_DIGIT_RE.sub('', digits)
+    return digits
+
+# Size of each validator's result cache. Migrations repeat the same values
+# (empty strings, shared domains/prefixes) often enough for this to pay off.
+_CACHE_SIZE = 4096
+
 class DataValidator:
     @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
     def validate_email(email: Optional[str]) -> Optional[str]:
         """Validate and clean email address"""
         if not email:
@@ -13,20 +35,19 @@ class DataValidator:
         email = email.strip().lower()
         
         # Basic email validation pattern
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        
-        if re.match(pattern, email):
+        if _EMAIL_RE.match(email):
             return email
         return None
 
     @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
     def validate_phone(phone: Optional[str]) -> Optional[str]:
         """Validate and clean phone number"""
         if not phone:
             return None
             
         # Remove all non-digit characters
-        phone = re.sub(r'\D', '', phone)
+        phone = _digits(phone)
         
         # Ensure minimum length (adjust as needed)
         if len(phone) >= 8:
@@ -34,15 +55,35 @@ class DataValidator:
         return None
 
     @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
     def validate_name(name: Optional[str]) -> Optional[str]:
         """Validate and clean name"""
         if not name:
             return None
             
         # Remove extra whitespace and special characters
-        name = re.sub(r'[^\w\s-]', '', name)
+        name = _NAME_STRIP_RE.sub('', name)
         name = ' '.join(name.split())
         
         if name:
             return name
-        return None
\ No newline at end of file
+        return None
+
+    @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def normalize_phone(phone: Optional[str]) -> Optional[str]:
+        """Reduce a phone number to a lookup key so '+971 50..' and '0097150..' match"""
+        if not phone:
+            return None
+
+        phone = _digits(phone)
+        if phone.startswith('00'):
+            phone = phone[2:]
+        return phone or None
+
+    @staticmethod
+    def normalize_email(email: Optional[str]) -> Optional[str]:
+        """Reduce an email address to a lookup key"""
+        if not email:
+            return None
+        return email.strip().lower() or None
\ No newline at end of file